@@ -0,0 +1,224 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Union
+from pandas import DataFrame
+from database import Column, Database, Table
+from fundementals import Fundemental, recordSnapshot
+
+
+
+
+
+class AsyncDatabase:
+    def __init__(self, databaseDirectory:str, pragmas:dict = None, readers:int = 4, batchSize:int = 1000) -> None:
+        """Database with Awaitable Reads and Writes that never Block the Event Loop
+
+        Reads run on a Pool of Reader Threads. Writes go through a Queue to a Single
+        Writer Thread that Commits every Write Waiting in the Queue as One Transaction.
+
+        :param databaseDirectory: Directory of the Database
+        :type databaseDirectory: str
+        :param pragmas: Pragmas to Override on every Connection
+        :type pragmas: dict
+        :param readers: Number of Reader Threads
+        :type readers: int
+        :param batchSize: Most Writes Committed in One Transaction
+        :type batchSize: int
+        """
+
+        # Database the Threads Work on
+        self.database = Database(databaseDirectory, pragmas)
+
+        # Most Writes Committed in One Transaction
+        self.batchSize = batchSize
+
+        # Reader Threads and the Single Writer Thread
+        self._readExecutor = ThreadPoolExecutor(readers, thread_name_prefix="DatabaseReader")
+        self._writeExecutor = ThreadPoolExecutor(1, thread_name_prefix="DatabaseWriter")
+
+        # Writes Waiting to be Committed and the Task Committing them
+        self._queue = None
+        self._writer = None
+
+    async def read(self, function:Callable, *args, **kwargs) -> Any:
+        """Run a Blocking Read on a Reader Thread
+
+        :param function: Read to Run
+        :type function: Callable
+        :return: Result of the Read
+        :rtype: Any
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._readExecutor, partial(function, *args, **kwargs))
+
+    async def write(self, function:Callable, *args, **kwargs) -> Any:
+        """Queue a Blocking Write for the Writer Thread and Wait for its Commit
+
+        A Write Cancelled before the Writer Thread Starts it is Skipped.
+
+        :param function: Write to Run
+        :type function: Callable
+        :return: Result of the Write
+        :rtype: Any
+        """
+
+        # Start the Writer on First Write
+        if self._writer is None:
+            self._queue = asyncio.Queue()
+            self._writer = asyncio.get_running_loop().create_task(self._write())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((future, partial(function, *args, **kwargs)))
+
+        return await future
+
+    async def _write(self) -> None:
+
+        while True:
+            # Wait for a Write then take every other Write Waiting
+            batch = [await self._queue.get()]
+            while not self._queue.empty() and len(batch) < self.batchSize:
+                batch.append(self._queue.get_nowait())
+
+            # Skip the Cancelled Writes
+            writes = [(future, function) for future, function in batch if not future.cancelled()]
+
+            try:
+                if writes:
+                    results = await asyncio.get_running_loop().run_in_executor(self._writeExecutor, self._commit, [function for _, function in writes])
+
+                    for (future, _), (error, result) in zip(writes, results):
+                        if future.cancelled(): continue
+
+                        if error is None:
+                            future.set_result(result)
+                        else:
+                            future.set_exception(error)
+            except Exception as error:
+                # The Commit Failed so every Write Failed
+                for future, _ in writes:
+                    if not future.done():
+                        future.set_exception(error)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _commit(self, functions:list[Callable]) -> list[tuple[Exception, Any]]:
+        """Run Writes in One Transaction, each in a Savepoint so a Failed Write only Rolls Back itself
+
+        :param functions: Writes to Run
+        :type functions: list[Callable]
+        :return: Error and Result of each Write
+        :rtype: list[tuple[Exception, Any]]
+        """
+        results = []
+
+        with self.database.transaction():
+            connection = self.database.connection
+
+            for function in functions:
+                connection.execute("SAVEPOINT write;")
+                try:
+                    results.append((None, function()))
+                except Exception as error:
+                    connection.execute("ROLLBACK TO write;")
+                    results.append((error, None))
+                connection.execute("RELEASE write;")
+
+        return results
+
+    async def record(self, fundemental:Fundemental) -> None:
+        """Write a Fundemental, made Lazy to Skip its Blocking Write in the Constructor
+
+        :param fundemental: Fundemental to Write
+        :type fundemental: Fundemental
+        :raises TypeError: Fundemental is Not on this Database
+        """
+        if fundemental.db is not self.database: raise TypeError("Fundemental is Not on this Database")
+
+        await self.write(fundemental.flush)
+
+    async def recordSnapshot(self, inputs:dict, ticker:str = None, date:str = None) -> dict[str, float]:
+        """Calculate every Fundemental from One Record and Write it as a Single Row, see fundementals.recordSnapshot
+
+        :param inputs: Inputs of the Fundementals by Name
+        :type inputs: dict
+        :param ticker: Ticker Symbol the Row Belongs to
+        :type ticker: str
+        :param date: Date of the Row, Today when None
+        :type date: str
+        :return: Percent of each Fundemental that has all of its Inputs in the Record
+        :rtype: dict[str, float]
+        """
+        return await self.write(recordSnapshot, inputs, self.database, ticker, date)
+
+    async def addTable(self, tableName:str, columns:list[Column], unique:list[str] = None) -> None:
+        await self.write(self.database.addTable, tableName, columns, unique)
+
+    async def deleteTable(self, tableName:str) -> None:
+        await self.write(self.database.deleteTable, tableName)
+
+    async def getTable(self, tableName:str) -> "AsyncTable":
+        return AsyncTable(await self.read(self.database.getTable, tableName), self)
+
+    async def tables(self) -> list["AsyncTable"]:
+        return [AsyncTable(table, self) for table in await self.read(lambda: self.database.tables)]
+
+    async def close(self) -> None:
+        """Wait for the Queued Writes then Close the Threads and Connections
+        """
+        if self._writer is not None:
+            await self._queue.join()
+            self._writer.cancel()
+            self._writer = None
+
+        self._readExecutor.shutdown()
+        self._writeExecutor.shutdown()
+        self.database.close()
+
+    async def __aenter__(self) -> "AsyncDatabase":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+class AsyncTable:
+    def __init__(self, table:Table, database:AsyncDatabase) -> None:
+        """Table with Awaitable Reads and Writes
+
+        :param table: Table to Read and Write
+        :type table: Table
+        :param database: Database the Table is in
+        :type database: AsyncDatabase
+        """
+
+        # Table
+        self.table = table
+
+        # Async Database
+        self.database = database
+
+    @property
+    def name(self) -> str:
+        return self.table.name
+
+    async def exist(self) -> bool:
+        return await self.database.read(lambda: Table.exist(self.name, self.table.connection))
+
+    async def update(self, df:DataFrame) -> None:
+        await self.database.write(self.table.update, df)
+
+    async def upsert(self, row:dict, key:Union[str,list[str]] = "Date") -> None:
+        await self.database.write(self.table.upsert, row, key)
+
+    async def upsertMany(self, rows:list[dict], key:Union[str,list[str]] = "Date") -> None:
+        await self.database.write(self.table.upsertMany, rows, key)
+
+    async def query(self, columns:list[str] = None, where:dict = None, start:str = None, end:str = None, limit:int = None) -> DataFrame:
+        return await self.database.read(self.table.query, columns, where, start, end, limit)
+
+    async def columns(self) -> list[str]:
+        return await self.database.read(lambda: self.table.columns)
+
+    async def data(self) -> DataFrame:
+        return await self.database.read(lambda: self.table.data)
@@ -0,0 +1,212 @@
+import argparse
+import json
+import subprocess
+import sys
+import tracemalloc
+from datetime import date, timedelta
+from os import path, remove
+from statistics import quantiles
+from tempfile import mkdtemp
+from time import perf_counter
+from typing import Callable
+from numpy.random import default_rng
+from pandas import DataFrame
+from database import Column, Database, Table
+from fundementals import FUNDEMENTALS, Fundemental
+
+# Milliseconds a Short-Lived Worker may Spend Importing the Fundementals
+IMPORT_BUDGET = 100
+
+
+
+
+
+def generate(rows:int, tickers:int = 1, fundementals:list[type[Fundemental]] = None, seed:int = 0, stored:bool = True) -> DataFrame:
+    """Synthetic Fundementals, each Ticker on Consecutive Dates
+
+    :param rows: Number of Rows
+    :type rows: int
+    :param tickers: Number of Tickers
+    :type tickers: int
+    :param fundementals: Fundemental Classes to Generate Inputs of, all of them when None
+    :type fundementals: list[type[Fundemental]]
+    :param seed: Seed of the Random Values
+    :type seed: int
+    :param stored: Name the Inputs as their Fundementals Table Columns instead of their Input Names
+    :type stored: bool
+    :return: Ticker, Date and the Inputs
+    :rtype: DataFrame
+    """
+    random = default_rng(seed)
+
+    # Ticker and Date of each Row
+    first = date(2000, 1, 1)
+    data = {
+        "Ticker":[f"T{row % tickers:05d}" for row in range(rows)],
+        "Date":[str(first + timedelta(days=row // tickers)) for row in range(rows)]
+    }
+
+    # Positive Inputs with some Missing
+    for fundemental in fundementals or FUNDEMENTALS:
+        for name in fundemental.columns if stored else fundemental.inputs:
+            values = random.uniform(0.1, 50, rows)
+            values[random.random(rows) < 0.01] = float("nan")
+            data[name] = values
+
+    return DataFrame(data)
+
+def measure(name:str, function:Callable, iterations:int, **parameters) -> dict:
+    """Time a Function and Trace its Peak Memory
+
+    :param name: Benchmark Name
+    :type name: str
+    :param function: Function to Run
+    :type function: Callable
+    :param iterations: Number of Runs
+    :type iterations: int
+    :return: Parameters, Throughput in Runs per Second, Latency Percentiles in Milliseconds and Peak Python Memory in Bytes
+    :rtype: dict
+    """
+
+    # Warm Up
+    function()
+
+    latencies = []
+
+    for _ in range(iterations):
+        start = perf_counter()
+        function()
+        latencies.append((perf_counter() - start)*1000)
+
+    # Peak Memory of One More Run, Traced Apart as Tracing Slows the Timed Runs
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    percentiles = quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies*99
+
+    return {
+        "benchmark":name, **parameters, "iterations":iterations,
+        "throughput":iterations/(sum(latencies)/1000),
+        "p50":percentiles[49], "p90":percentiles[89], "p99":percentiles[98],
+        "peakMemory":peak
+    }
+
+def measureImport(module:str = "fundementals", iterations:int = 20, budget:float = IMPORT_BUDGET) -> dict:
+    """Time Importing a Module in a New Interpreter, as a Short-Lived Worker would
+
+    :param module: Module Name
+    :type module: str
+    :param iterations: Number of Interpreters
+    :type iterations: int
+    :param budget: Milliseconds the Median Import may Take
+    :type budget: float
+    :return: Latency Percentiles in Milliseconds, the Budget, if the Median is within it and the Heavy Modules Imported
+    :rtype: dict
+    """
+    code = (
+        "import sys, time; start = time.perf_counter(); import " + module + "; "
+        "print(time.perf_counter() - start, *[name for name in ('numpy', 'pandas') if name in sys.modules])"
+    )
+
+    latencies, heavy = [], set()
+
+    for _ in range(iterations):
+        output = subprocess.run([sys.executable, "-c", code], cwd=path.dirname(path.abspath(__file__)), capture_output=True, text=True, check=True).stdout.split()
+        latencies.append(float(output[0])*1000)
+        heavy.update(output[1:])
+
+    percentiles = quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies*99
+
+    return {
+        "benchmark":f"import.{module}", "iterations":iterations,
+        "p50":percentiles[49], "p90":percentiles[89], "p99":percentiles[98],
+        "budget":budget, "withinBudget":percentiles[49] <= budget, "heavyModules":sorted(heavy)
+    }
+
+def run(rows:int, tickers:int, fundementals:list[type[Fundemental]], iterations:int, directory:str) -> list[dict]:
+    """Benchmark the Reads, Writes and Percent Calculations on a Table of the Rows
+
+    :param rows: Number of Rows in the Table
+    :type rows: int
+    :param tickers: Number of Tickers
+    :type tickers: int
+    :param fundementals: Fundemental Classes in the Table
+    :type fundementals: list[type[Fundemental]]
+    :param iterations: Number of Runs of each Benchmark
+    :type iterations: int
+    :param directory: Directory of the Database
+    :type directory: str
+    :return: Results of each Benchmark
+    :rtype: list[dict]
+    """
+    parameters = {"rows":rows, "tickers":tickers, "fundementals":[fundemental.__name__ for fundemental in fundementals]}
+
+    # Database Filled with the Synthetic Rows
+    databaseDirectory = path.join(directory, f"benchmark_{rows}_{tickers}.db")
+    if Database.exist(databaseDirectory): Database.delete(databaseDirectory)
+    db = Database(databaseDirectory)
+
+    data = generate(rows, tickers, fundementals)
+    db.addTable("Fundementals", [Column("Ticker",str), Column("Date",str)] + [Column(name,float) for name in data.columns[2:]], unique=["Ticker","Date"])
+    table = db.getTable("Fundementals")
+
+    with db.transaction():
+        table.upsertMany(data.astype(object).where(data.notna(), None).to_dict("records"), ["Ticker","Date"])
+
+    # Inputs of the Percent Calculations
+    inputs = generate(rows, tickers, fundementals, stored=False)
+
+    # One Row and One Fundemental Instance of each Class
+    row = {**data.iloc[rows // 2].to_dict(), "Ticker":"BENCH"}
+    instances = [fundemental(**{name:1.5 for name in fundemental.inputs}, database=db, ticker="BENCH", lazy=True) for fundemental in fundementals]
+
+    results = [
+        measure("Table.data", lambda: table.data, max(1, iterations // 10), **parameters),
+        measure("Table.query.row", lambda: table.query(where={"Ticker":row["Ticker"], "Date":row["Date"]}), iterations, **parameters),
+        measure("Table.exist", lambda: Table.exist("Fundementals", db.connection), iterations, **parameters),
+        measure("Database.tables", lambda: db.tables, iterations, **parameters),
+        measure("Table.upsert", lambda: table.upsert(row, ["Ticker","Date"]), iterations, **parameters),
+        measure("Fundemental._updateDatabase", lambda: [instance._updateDatabase() for instance in instances], iterations, **parameters),
+        *[measure(f"{fundemental.__name__}.calculatePercents", lambda fundemental=fundemental: fundemental.calculatePercents(*[inputs[name] for name in fundemental.inputs]), iterations, **parameters) for fundemental in fundementals],
+        measure("Table.update", lambda: table.update(table.data), max(1, iterations // 10), **parameters)
+    ]
+
+    db.close()
+    Database.delete(databaseDirectory)
+    for suffix in ("-wal", "-shm"):
+        if path.exists(databaseDirectory + suffix): remove(databaseDirectory + suffix)
+
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the Database and Fundementals Hot Paths, One JSON Result per Line")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000, 1000000], help="Table Sizes")
+    parser.add_argument("--tickers", type=int, nargs="+", default=[1, 100], help="Ticker Counts")
+    parser.add_argument("--fundementals", nargs="+", default=[fundemental.__name__ for fundemental in FUNDEMENTALS], help="Fundemental Classes in the Table")
+    parser.add_argument("--iterations", type=int, default=100, help="Runs of each Benchmark")
+    parser.add_argument("--directory", default=None, help="Directory of the Benchmark Databases")
+    parser.add_argument("--output", default=None, help="File to Write the Results to, Standard Output when None")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET, help="Milliseconds Importing the Fundementals may Take")
+    arguments = parser.parse_args()
+
+    # Fundemental Classes by Name
+    classes = {fundemental.__name__:fundemental for fundemental in FUNDEMENTALS}
+    fundementals = [classes[name] for name in arguments.fundementals]
+
+    directory = arguments.directory or mkdtemp()
+    output = open(arguments.output, "w") if arguments.output else None
+
+    try:
+        print(json.dumps(measureImport(budget=arguments.import_budget)), file=output, flush=True)
+
+        for rows in arguments.rows:
+            for tickers in arguments.tickers:
+                for result in run(rows, tickers, fundementals, arguments.iterations, directory):
+                    print(json.dumps(result), file=output, flush=True)
+    finally:
+        if output is not None: output.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+from typing import Iterator, Union
+from numpy import asarray, integer, ndarray
+from pandas import DataFrame
+from fundementals import Fundemental
+
+
+
+
+
+class FundementalValue:
+    __slots__ = ("fundemental", "ticker", "inputs", "percent")
+
+    def __init__(self, fundemental:type[Fundemental], ticker:str, inputs:tuple, percent:float) -> None:
+        """Single Value of a Fundemental without an Instance Dictionary
+
+        :param fundemental: Fundemental Class
+        :type fundemental: type[Fundemental]
+        :param ticker: Ticker Symbol
+        :type ticker: str
+        :param inputs: Inputs in the Order of the Fundemental's Inputs
+        :type inputs: tuple
+        :param percent: Percent of the Inputs
+        :type percent: float
+        """
+        self.fundemental = fundemental
+        self.ticker = ticker
+        self.inputs = inputs
+        self.percent = percent
+
+    def __getattr__(self, name:str) -> float:
+
+        # Inputs by Name, e.g. forwardPE
+        if name in type(self).__slots__: raise AttributeError(name)
+        try:
+            return self.inputs[self.fundemental.inputs.index(name)]
+        except ValueError:
+            raise AttributeError(name) from None
+
+    def __repr__(self) -> str:
+        return f"{self.fundemental.__name__}({self.ticker}: {round(self.percent*100,2)}%)"
+
+class FundementalArray:
+    def __init__(self, fundemental:type[Fundemental], tickers:list = None, **inputs) -> None:
+        """Values of a Fundemental held as One Float Array per Input and for the Percent
+
+        :param fundemental: Fundemental Class
+        :type fundemental: type[Fundemental]
+        :param tickers: Ticker Symbol of each Value
+        :type tickers: list
+        :raises TypeError: Fundemental is Missing Inputs
+        :raises TypeError: Inputs Must have the Same Length
+        """
+        for name in fundemental.inputs:
+            if name not in inputs: raise TypeError(f"{fundemental.__name__} is Missing the {name} Input")
+
+        # Fundemental Class
+        self.fundemental = fundemental
+
+        # Float Array of each Input, None as NaN
+        self.inputs = {name:asarray(inputs[name], dtype=float) for name in fundemental.inputs}
+
+        # Percents, Calculated at once
+        self.percents = fundemental.calculatePercents(*self.inputs.values())
+
+        # Ticker Symbols
+        self.tickers = asarray(tickers, dtype=object) if tickers is not None else None
+
+        for array in [*self.inputs.values(), *([self.tickers] if self.tickers is not None else [])]:
+            if len(array) != len(self.percents): raise TypeError("Inputs Must have the Same Length")
+
+    @classmethod
+    def fromFundementals(cls, fundementals:list[Fundemental]) -> "FundementalArray":
+        """Pack Fundemental Instances of One Class
+
+        :param fundementals: Fundemental Instances
+        :type fundementals: list[Fundemental]
+        :raises TypeError: Fundementals Must be of One Class
+        :return: Fundemental Array
+        :rtype: FundementalArray
+        """
+        fundemental = type(fundementals[0])
+        if any(type(instance) is not fundemental for instance in fundementals): raise TypeError("Fundementals Must be of One Class")
+
+        return cls(
+            fundemental,
+            [instance.ticker for instance in fundementals],
+            **{name:[getattr(instance, name) for instance in fundementals] for name in fundemental.inputs}
+        )
+
+    @classmethod
+    def _view(cls, fundemental:type[Fundemental], tickers:ndarray, inputs:dict, percents:ndarray) -> "FundementalArray":
+        array = cls.__new__(cls)
+        array.fundemental, array.tickers, array.inputs, array.percents = fundemental, tickers, inputs, percents
+
+        return array
+
+    def __len__(self) -> int:
+        return len(self.percents)
+
+    def __getitem__(self, index:Union[int, slice, ndarray]) -> Union[FundementalValue, "FundementalArray"]:
+        """Value at a Position, or the Values at a Slice or Mask as an Array Sharing Memory where NumPy Allows
+
+        :param index: Position, Slice, Mask or Positions
+        :type index: Union[int, slice, ndarray]
+        :return: Value or Fundemental Array
+        :rtype: Union[FundementalValue, FundementalArray]
+        """
+        # Single Value, Built on Access
+        if isinstance(index, (int, integer)):
+            return FundementalValue(
+                self.fundemental,
+                self.tickers[index] if self.tickers is not None else None,
+                tuple(float(array[index]) for array in self.inputs.values()),
+                float(self.percents[index])
+            )
+
+        # Values at a Slice Share the Arrays, a Mask or Positions Copy them
+        return self._view(
+            self.fundemental,
+            self.tickers[index] if self.tickers is not None else None,
+            {name:array[index] for name, array in self.inputs.items()},
+            self.percents[index]
+        )
+
+    def __iter__(self) -> Iterator[FundementalValue]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def toDataFrame(self) -> DataFrame:
+        """Ticker, Inputs and Percent as Columns over the Arrays without Copying them
+
+        :return: Values
+        :rtype: DataFrame
+        """
+        return DataFrame({
+            **({"Ticker":self.tickers} if self.tickers is not None else {}),
+            **self.inputs,
+            "Percent":self.percents
+        }, copy=False)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of the Input and Percent Arrays
+
+        :return: Bytes
+        :rtype: int
+        """
+        return sum(array.nbytes for array in self.inputs.values()) + self.percents.nbytes
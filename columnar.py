@@ -0,0 +1,847 @@
+import json
+import threading
+from contextlib import contextmanager
+from os import listdir, makedirs, path, remove, replace
+from shutil import rmtree
+from typing import Iterator, Union
+from numpy import argsort, array as nparray, concatenate, dtype as npdtype, flatnonzero, full, load, nan, ndarray, ones, save, searchsorted, sort as npsort, where as npwhere
+from numpy.lib.format import open_memmap
+from pandas import DataFrame
+from database import Column
+
+# NumPy Datatypes of the Column Types, Strings are Fixed Width to be Memory Mapped and Widened to Fit Longer Values
+DTYPES = {int:"int64", float:"float64", str:"<U32", bool:"bool"}
+
+# Rows the Columns Grow by at Least
+GROWTH = 1024
+
+# File of the Row Positions Sorted by Date, the Date Index
+ORDER = "Date.order.npy"
+
+# Suffix of the Arrays Marking the Missing Rows of Integer and Boolean Columns, which have No Missing Value of their own
+MASK = ".mask"
+
+
+
+
+
+class ColumnarTable:
+    def __init__(self, tableName:str, database:"ColumnarDatabase") -> None:
+        """Table stored as a Memory Mapped NumPy Array File per Column
+
+        :param tableName: Table Name
+        :type tableName: str
+        :param database: Database the Table is in
+        :type database: ColumnarDatabase
+        """
+        # Table Name
+        self.name = tableName
+
+        # Database
+        self.database = database
+
+        # Directory of the Column Files
+        self.directory = path.join(database.databaseDirectory, tableName)
+
+        # Row Positions of each Key, Built on First Upsert
+        self._indexes = {}
+
+        # Rows, Columns and Values Overwritten since the Open Transaction Started, to Roll Back to
+        self._undo = None
+
+        # Row Positions Sorted by Date, their Dates, and the Rows Appended at Later Dates since, when the Date is Indexed
+        self._order = None
+        self._sorted = None
+        self._pending = []
+
+        self._load()
+
+    def _load(self) -> None:
+
+        # Schema of the Table
+        with open(path.join(self.directory, "schema.json")) as file:
+            schema = json.load(file)
+
+        self._rows = schema["rows"]
+        self._dtypes = {column["name"]:column["dtype"] for column in schema["columns"]}
+        self.unique = schema["unique"]
+        self.indexed = schema.get("indexes", [])
+
+        # Memory Mapped Columns, and the Missing Rows of the Integer and Boolean Columns
+        self._arrays = {name:open_memmap(path.join(self.directory, f"{name}.npy"), mode="r+") for name in self._dtypes}
+
+        for name, dtype in self._dtypes.items():
+            if not self._masked(dtype): continue
+
+            # Tables from before the Masks have No Missing Rows
+            file = path.join(self.directory, f"{name}{MASK}.npy")
+            if not path.exists(file):
+                mask = open_memmap(file, mode="w+", dtype="bool", shape=self._arrays[name].shape)
+                mask[:] = True
+                mask[:self._rows] = False
+                mask.flush()
+
+            self._arrays[f"{name}{MASK}"] = open_memmap(file, mode="r+")
+
+        # Date Index Saved when the Table was Closed, Used if No Row was Added since
+        file = path.join(self.directory, ORDER)
+        if "Date" in self.indexed and path.exists(file):
+            order = load(file)
+            if len(order) == self._rows: self._order = order
+
+    def _save(self) -> None:
+        """Flush the Columns and Write the Schema, Deferred until the End of an Open Transaction
+        """
+        if self.database.transactionDepth > 0:
+            self.database._dirty.add(self)
+            return
+
+        for array in self._arrays.values():
+            array.flush()
+
+        ColumnarTable._writeSchema(self.directory, [{"name":name, "dtype":dtype} for name, dtype in self._dtypes.items()], self._rows, self.unique, self.indexed)
+
+    def _saveOrder(self) -> None:
+        """Write the Date Index next to the Columns, so Reopening the Table does Not Sort the Dates again
+        """
+        if self._order is None: return
+
+        order, _ = self._dates()
+        file = path.join(self.directory, ORDER)
+        with open(f"{file}.tmp", "wb") as temporary:
+            save(temporary, order)
+
+        replace(f"{file}.tmp", file)
+
+    @staticmethod
+    def _writeSchema(directory:str, columns:list[dict], rows:int, unique:list[str], indexes:list[str] = None) -> None:
+
+        # Write then Replace so a Crash never Leaves a Torn Schema
+        with open(path.join(directory, "schema.json.tmp"), "w") as file:
+            json.dump({"columns":columns, "rows":rows, "unique":unique, "indexes":indexes or []}, file)
+
+        replace(path.join(directory, "schema.json.tmp"), path.join(directory, "schema.json"))
+
+    @staticmethod
+    def _missing(dtype:str) -> Union[float,str,int]:
+        """Value of a Missing Entry in a Column
+
+        :param dtype: NumPy Datatype of the Column
+        :type dtype: str
+        :return: NaN, Empty String or Zero
+        :rtype: Union[float,str,int]
+        """
+        kind = npdtype(dtype).kind
+
+        return nan if kind == "f" else "" if kind == "U" else 0
+
+    @staticmethod
+    def _masked(dtype:str) -> bool:
+        """Checks if a Column Marks its Missing Rows in a Mask, having No Missing Value of its own
+
+        :param dtype: NumPy Datatype of the Column
+        :type dtype: str
+        :return: If the Column is Masked
+        :rtype: bool
+        """
+        return npdtype(dtype).kind in "ib"
+
+    def _fill(self, name:str) -> Union[float,str,int,bool]:
+        return True if name.endswith(MASK) else self._missing(self._dtypes[name])
+
+    def _begin(self) -> None:
+        """Remember the Rows and Columns before the First Write in an Open Transaction
+        """
+        if self.database.transactionDepth == 0 or self._undo is not None: return
+
+        self._undo = {"rows":self._rows, "dtypes":dict(self._dtypes), "values":{}}
+        self.database._dirty.add(self)
+
+    def _remember(self, name:str, positions:Union[int, slice]) -> None:
+        """Remember the Values of a Column before Overwriting them in an Open Transaction
+
+        :param name: Column Name
+        :type name: str
+        :param positions: Row Position or Positions
+        :type positions: Union[int, slice]
+        """
+        if self._undo is None or name.removesuffix(MASK) not in self._undo["dtypes"]: return
+
+        values = self._undo["values"].setdefault(name, {})
+
+        for position in range(*positions.indices(self._undo["rows"])) if isinstance(positions, slice) else [positions]:
+            if position < self._undo["rows"] and position not in values:
+                values[position] = self._arrays[name][position].item()
+
+    def _rollback(self) -> None:
+        """Undo the Writes since the Open Transaction Started
+        """
+        undo, self._undo = self._undo, None
+        if undo is None: return
+
+        # Drop the Columns Added
+        for name in [name for name in self._dtypes if name not in undo["dtypes"]]:
+            for array in [name, f"{name}{MASK}"] if self._masked(self._dtypes[name]) else [name]:
+                del self._arrays[array]
+                remove(path.join(self.directory, f"{array}.npy"))
+            del self._dtypes[name]
+
+        # Restore the Values Overwritten and Clear the Rows Added
+        for name, values in undo["values"].items():
+            for position, value in values.items():
+                self._arrays[name][position] = value
+
+        for name, array in self._arrays.items():
+            array[undo["rows"]:self._rows] = self._fill(name)
+
+        self._rows = undo["rows"]
+        self._indexes = {}
+        self._invalidateOrder()
+        self._save()
+
+    def _fit(self, name:str, values:list) -> None:
+        """Widen a Text Column so the Values are Not Cut Short
+
+        :param name: Column Name
+        :type name: str
+        :param values: Values to Write to the Column
+        :type values: list
+        """
+        dtype = npdtype(self._dtypes[name])
+        if dtype.kind != "U": return
+
+        width = max((len(value) for value in values if isinstance(value, str)), default=0)
+        if width <= dtype.itemsize // 4: return
+
+        # Widened Column File, Written Aside then Swapped in
+        array = self._arrays[name]
+        wider = f"<U{max(width, 2*(dtype.itemsize // 4))}"
+        file = path.join(self.directory, f"{name}.npy")
+        widened = open_memmap(f"{file}.tmp", mode="w+", dtype=wider, shape=array.shape)
+        widened[:] = array
+        widened.flush()
+
+        del array, self._arrays[name]
+        replace(f"{file}.tmp", file)
+        self._arrays[name] = open_memmap(file, mode="r+")
+        self._dtypes[name] = wider
+        self._save()
+
+    @staticmethod
+    def exist(tableName:str, databaseDirectory:str) -> bool:
+        """Checks the Tables Existance in the Database
+
+        :param tableName: Table Name
+        :type tableName: str
+        :param databaseDirectory: Database Directory
+        :type databaseDirectory: str
+        :return: If the Table Exists
+        :rtype: bool
+        """
+        return path.exists(path.join(databaseDirectory, tableName, "schema.json"))
+
+    @staticmethod
+    def create(tableName:str, columns:list[Column], databaseDirectory:str, unique:list[str] = None) -> None:
+        """Create a Table in the Database
+
+        :param tableName: Table Name
+        :type tableName: str
+        :param columns: Columns
+        :type columns: list[Column]
+        :param databaseDirectory: Database Directory
+        :type databaseDirectory: str
+        :param unique: Column Names that together Key each Row
+        :type unique: list[str]
+        :raises TypeError: Table Already Exists
+        """
+        if ColumnarTable.exist(tableName, databaseDirectory): raise TypeError("Table Already Exists")
+
+        directory = path.join(databaseDirectory, tableName)
+        makedirs(directory, exist_ok=True)
+
+        # Creating the Column Files, with a Mask of the Missing Rows for Integers and Booleans
+        for column in columns:
+            open_memmap(path.join(directory, f"{column.name}.npy"), mode="w+", dtype=DTYPES[column.dtype], shape=(GROWTH,))[:] = ColumnarTable._missing(DTYPES[column.dtype])
+            if ColumnarTable._masked(DTYPES[column.dtype]):
+                open_memmap(path.join(directory, f"{column.name}{MASK}.npy"), mode="w+", dtype="bool", shape=(GROWTH,))[:] = True
+
+        ColumnarTable._writeSchema(directory, [{"name":column.name, "dtype":DTYPES[column.dtype]} for column in columns], 0, unique or [])
+
+    @staticmethod
+    def delete(tableName:str, databaseDirectory:str) -> None:
+        """Delete the Table in the Database
+
+        :param tableName: Table Name
+        :type tableName: str
+        :param databaseDirectory: Database Directory
+        :type databaseDirectory: str
+        :raises TypeError: Table Does Not Exist
+        """
+        if not ColumnarTable.exist(tableName, databaseDirectory): raise TypeError(f"{tableName} Table Does Not Exist")
+
+        rmtree(path.join(databaseDirectory, tableName))
+
+    def _reserve(self, rows:int) -> None:
+        """Grow every Column File to Hold at Least the Rows
+
+        :param rows: Rows to Hold
+        :type rows: int
+        """
+        for name, array in list(self._arrays.items()):
+            if len(array) >= rows: continue
+
+            # Grown Column File, Written Aside then Swapped in
+            capacity = max(rows, 2*len(array), GROWTH)
+            file = path.join(self.directory, f"{name}.npy")
+            grown = open_memmap(f"{file}.tmp", mode="w+", dtype=array.dtype, shape=(capacity,))
+            grown[:len(array)] = array
+            grown[len(array):] = self._fill(name)
+            grown.flush()
+
+            del array, self._arrays[name]
+            replace(f"{file}.tmp", file)
+            self._arrays[name] = open_memmap(file, mode="r+")
+
+    def update(self, df:DataFrame) -> None:
+        """Update the Table to the Dataframe Given
+
+        :param df: The Updated DataFrame
+        :type df: DataFrame
+        """
+        with self.database.lock:
+            self._begin()
+
+            # Columns the Table is Missing
+            for name in df.columns:
+                if name not in self._dtypes:
+                    self.addColumn(Column(name, str if df[name].dtype.kind in "OUS" else float))
+
+            self._reserve(len(df))
+
+            for name in df.columns:
+                self._fit(name, df[name].tolist())
+
+            for name, array in self._arrays.items():
+                self._remember(name, slice(None))
+                array[:] = self._fill(name)
+
+                column = name.removesuffix(MASK)
+                if column not in df.columns: continue
+
+                # Missing Rows as the Missing Value of the Column, or Marked in its Mask
+                values = df[column]
+                if name.endswith(MASK):
+                    array[:len(df)] = values.isna().to_numpy()
+                elif npdtype(self._dtypes[name]).kind in "Uib":
+                    array[:len(df)] = values.where(values.notna(), self._missing(self._dtypes[name])).to_numpy()
+                else:
+                    array[:len(df)] = values.to_numpy()
+
+            self._rows = len(df)
+            self._indexes = {}
+            self._invalidateOrder()
+            self._save()
+
+    def addColumn(self, column:Column) -> None:
+        """Add a Column to the Table in Place
+
+        :param column: Column to add to the Table
+        :type column: Column
+        :raises TypeError: Column Already Exists
+        """
+        with self.database.lock:
+            if column.name in self._dtypes: raise TypeError(f"{column.name} Column Already Exists")
+            self._begin()
+
+            dtype = DTYPES[column.dtype]
+            file = path.join(self.directory, f"{column.name}.npy")
+
+            # Creating the Column File with every Row Missing
+            open_memmap(file, mode="w+", dtype=dtype, shape=(max(self._rows, GROWTH),))[:] = self._missing(dtype)
+            if self._masked(dtype):
+                open_memmap(path.join(self.directory, f"{column.name}{MASK}.npy"), mode="w+", dtype="bool", shape=(max(self._rows, GROWTH),))[:] = True
+                self._arrays[f"{column.name}{MASK}"] = open_memmap(path.join(self.directory, f"{column.name}{MASK}.npy"), mode="r+")
+
+            self._dtypes[column.name] = dtype
+            self._arrays[column.name] = open_memmap(file, mode="r+")
+            self._save()
+
+    def addIndex(self, columns:list[str], unique:bool = False) -> None:
+        """Index the Date as the Row Positions Sorted by Date, so Start and End are Found by Binary Search
+
+        Indexes of Keys are Built in Memory on First Upsert, so Indexing any other Columns does Nothing.
+
+        :param columns: Column Names to Index together
+        :type columns: list[str]
+        :param unique: If the Index is Unique
+        :type unique: bool
+        """
+        if list(columns) != ["Date"] or "Date" not in self._dtypes: return
+
+        with self.database.lock:
+            if "Date" in self.indexed: return
+
+            self.indexed = [*self.indexed, "Date"]
+            self._invalidateOrder()
+            self._save()
+
+    def _invalidateOrder(self) -> None:
+        """Drop the Date Index, Rebuilt on First Use, after Rows were Written Out of Date Order
+        """
+        self._order, self._sorted, self._pending = None, None, []
+
+        if path.exists(path.join(self.directory, ORDER)): remove(path.join(self.directory, ORDER))
+
+    def _dates(self) -> tuple[ndarray, ndarray]:
+        """Row Positions Sorted by Date and their Dates, Sorted on First Use then Extended with the Rows Appended at Later Dates
+
+        :return: Row Positions and Dates
+        :rtype: tuple[ndarray, ndarray]
+        """
+        dates = self._arrays["Date"][:self._rows]
+
+        if self._order is None:
+            self._order = argsort(dates, kind="stable")
+
+        if self._sorted is None:
+            self._sorted = dates[self._order]
+
+        if self._pending:
+            pending = nparray(self._pending, dtype=self._order.dtype)
+            self._order, self._sorted, self._pending = concatenate([self._order, pending]), concatenate([self._sorted, dates[pending]]), []
+
+        return self._order, self._sorted
+
+    def _indexDate(self, position:int) -> None:
+        """Keep the Date Index Sorted after Appending a Row, Extending it when the Row is at the Latest Date
+
+        :param position: Row Position of the Row Appended
+        :type position: int
+        """
+        if self._order is None: return
+
+        # Latest Date in the Index
+        last = self._pending[-1] if self._pending else self._order[-1] if len(self._order) else None
+
+        if last is None or self._arrays["Date"][position] >= self._arrays["Date"][last]:
+            self._pending.append(position)
+        else:
+            self._invalidateOrder()
+
+    def _index(self, keys:tuple) -> dict:
+        """Row Position of each Key
+
+        :param keys: Key Column Names
+        :type keys: tuple
+        :return: Key Values and their Row Position
+        :rtype: dict
+        """
+        if keys not in self._indexes:
+            self._indexes[keys] = {key:row for row, key in enumerate(zip(*[self._keys(name) for name in keys]))}
+
+        return self._indexes[keys]
+
+    def _keys(self, name:str) -> list:
+        """Key Values of a Column, Missing Integers and Booleans as None
+
+        :param name: Column Name
+        :type name: str
+        :return: Key Value of each Row
+        :rtype: list
+        """
+        values = self._arrays[name][:self._rows].tolist()
+        if not self._masked(self._dtypes[name]): return values
+
+        return [None if missing else value for value, missing in zip(values, self._arrays[f"{name}{MASK}"][:self._rows].tolist())]
+
+    def _key(self, name:str, value) -> Union[float,str,int,bool]:
+        return value if self._masked(self._dtypes[name]) else self._value(name, value)
+
+    def _value(self, name:str, value) -> Union[float,str,int]:
+        return self._missing(self._dtypes[name]) if value is None else value
+
+    def _read(self, name:str, positions:Union[ndarray, slice]) -> ndarray:
+        """Copy of the Values of a Column at the Positions, so Later Writes do Not Change them, Missing Text Read as None as SQLite Reads NULL
+
+        :param name: Column Name
+        :type name: str
+        :param positions: Row Positions
+        :type positions: Union[ndarray, slice]
+        :return: Values
+        :rtype: ndarray
+        """
+        values = self._arrays[name][:self._rows][positions]
+
+        if values.dtype.kind == "U":
+            return npwhere(values == "", None, values.astype(object))
+
+        # Missing Integers and Booleans as NaN, or None when every Row is Missing, as Pandas Reads NULL from SQLite
+        if self._masked(values.dtype):
+            missing = self._arrays[f"{name}{MASK}"][:self._rows][positions]
+            if missing.all() and len(missing): return full(len(missing), None, dtype=object)
+            if missing.any(): return npwhere(missing, nan, values.astype(float))
+
+        return nparray(values)
+
+    def upsert(self, row:dict, key:Union[str,list[str]] = "Date") -> None:
+        """Insert the Row or Update the Row with the same Key
+
+        :param row: Column Names and Values of the Row
+        :type row: dict
+        :param key: Column Name or Names the Row is Keyed on
+        :type key: Union[str,list[str]]
+        :raises TypeError: Key Not in the Row
+        """
+        self.upsertMany([row], key)
+
+    def upsertMany(self, rows:list[dict], key:Union[str,list[str]] = "Date") -> None:
+        """Insert the Rows or Update the Rows with the same Key
+
+        :param rows: Column Names and Values of each Row
+        :type rows: list[dict]
+        :param key: Column Name or Names the Rows are Keyed on
+        :type key: Union[str,list[str]]
+        :raises TypeError: Key Not in the Row
+        :raises TypeError: Column Does Not Exist
+        """
+
+        # Key Column Names
+        keys = (key,) if isinstance(key, str) else tuple(key)
+
+        with self.database.lock:
+            self._begin()
+            index = self._index(keys)
+
+            for row in rows:
+                for name in keys:
+                    if name not in row: raise TypeError(f"{name} Not in the Row")
+                for name in row:
+                    if name not in self._dtypes: raise TypeError(f"{name} Column Does Not Exist")
+
+            # Widen the Text Columns the Rows Do Not Fit in
+            for name in dict.fromkeys(name for row in rows for name in row):
+                self._fit(name, [row[name] for row in rows if name in row])
+
+            for row in rows:
+
+                values = tuple(self._key(name, row[name]) for name in keys)
+
+                # Append the Row if the Key Does Not Exist
+                appended = values not in index
+                if appended:
+                    self._reserve(self._rows + 1)
+                    index[values] = self._rows
+                    self._rows += 1
+
+                # Rows Moved to Another Date Leave the Date Index Out of Order
+                elif "Date" in row and self._order is not None and self._arrays["Date"][index[values]] != self._value("Date", row["Date"]):
+                    self._invalidateOrder()
+
+                for name, value in row.items():
+                    self._remember(name, index[values])
+                    self._arrays[name][index[values]] = self._value(name, value)
+
+                    if f"{name}{MASK}" in self._arrays:
+                        self._remember(f"{name}{MASK}", index[values])
+                        self._arrays[f"{name}{MASK}"][index[values]] = value is None
+
+                if appended:
+                    self._indexDate(index[values])
+
+            self._save()
+
+    @property
+    def columns(self) -> list[str]:
+        """Column Names of the Table
+
+        :return: Column Names
+        :rtype: list[str]
+        """
+        return list(self._dtypes)
+
+    @property
+    def arrays(self) -> dict[str, ndarray]:
+        """Zero Copy Views of the Columns
+
+        :return: Column Names and their Values
+        :rtype: dict[str, ndarray]
+        """
+        return {name:self._arrays[name][:self._rows] for name in self._dtypes}
+
+    def _positions(self, where:dict = None, start:str = None, end:str = None, limit:int = None) -> Union[ndarray, slice]:
+        """Rows Matching the Filters
+
+        :return: Row Positions, a Slice when there is Nothing to Filter
+        :rtype: Union[ndarray, slice]
+        """
+        if not where and start is None and end is None:
+            return slice(0, self._rows if limit is None else min(limit, self._rows))
+
+        # Rows in the Dates by Binary Search of the Date Index, Missing Dates Left Out as SQLite Leaves Out NULL
+        positions = None
+        if (start is not None or end is not None) and "Date" in self.indexed:
+            order, dates = self._dates()
+            first = max(searchsorted(dates, "", side="right"), searchsorted(dates, start, side="left") if start is not None else 0)
+            last = searchsorted(dates, end, side="right") if end is not None else len(dates)
+            positions = npsort(order[first:max(first, last)])
+
+        # Values of a Column at the Rows in the Dates, or at every Row
+        def values(name:str) -> ndarray:
+            return self._arrays[name][:self._rows] if positions is None else self._arrays[name][positions]
+
+        mask = ones(self._rows if positions is None else len(positions), dtype=bool)
+
+        for name, value in (where or {}).items():
+
+            # Integers and Booleans Match None by their Mask, and Values Only where Not Missing
+            if self._masked(self._dtypes[name]):
+                missing = values(f"{name}{MASK}")
+                mask &= missing if value is None else (values(name) == value) & ~missing
+            else:
+                mask &= values(name) == self._value(name, value)
+
+        # Rows in the Dates by Scanning, when the Date is Not Indexed
+        if positions is None:
+            dates = values("Date")
+
+            if start is not None:
+                mask &= (dates >= start) & (dates != "")
+
+            if end is not None:
+                mask &= (dates <= end) & (dates != "")
+
+            return flatnonzero(mask)[:limit]
+
+        return positions[mask][:limit]
+
+    def query(self, columns:list[str] = None, where:dict = None, start:str = None, end:str = None, limit:int = None) -> DataFrame:
+        """Rows of the Table Filtered with Vectorized Masks, Copied so they are a Snapshot, see Arrays for Zero Copy Views
+
+        :param columns: Column Names to Select, all when None
+        :type columns: list[str]
+        :param where: Column Names and the Value each must Equal
+        :type where: dict
+        :param start: First Date to Select
+        :type start: str
+        :param end: Last Date to Select
+        :type end: str
+        :param limit: Most Rows to Select
+        :type limit: int
+        :return: Selected Rows
+        :rtype: DataFrame
+        """
+        positions = self._positions(where, start, end, limit)
+
+        return DataFrame({name:self._read(name, positions) for name in columns or self._dtypes}, copy=False)
+
+    def stream(self, chunkSize:int = 10000, columns:list[str] = None, where:dict = None, start:str = None, end:str = None, records:bool = False) -> Iterator[Union[DataFrame, list[tuple]]]:
+        """Rows of the Table in Chunks
+
+        :param chunkSize: Most Rows in each Chunk
+        :type chunkSize: int
+        :param columns: Column Names to Select, all when None
+        :type columns: list[str]
+        :param where: Column Names and the Value each must Equal
+        :type where: dict
+        :param start: First Date to Select
+        :type start: str
+        :param end: Last Date to Select
+        :type end: str
+        :param records: Yield Lists of Row Tuples instead of DataFrames
+        :type records: bool
+        :raises TypeError: Chunk Size Must be Positive
+        :return: Chunks of Rows
+        :rtype: Iterator[Union[DataFrame, list[tuple]]]
+        """
+        if chunkSize < 1: raise TypeError("Chunk Size Must be Positive")
+
+        positions = self._positions(where, start, end)
+        if isinstance(positions, slice):
+            positions = range(positions.start, positions.stop)
+
+        for first in range(0, len(positions), chunkSize):
+            chunk = DataFrame({name:self._read(name, positions[first:first + chunkSize]) for name in columns or self._dtypes}, copy=False)
+
+            yield list(chunk.itertuples(index=False, name=None)) if records else chunk
+
+    def tickerData(self, ticker:str) -> DataFrame:
+        """Rows of a Single Ticker
+
+        :param ticker: Ticker Symbol
+        :type ticker: str
+        :return: Rows of the Ticker
+        :rtype: DataFrame
+        """
+        return self.query(where={"Ticker":ticker})
+
+    @property
+    def tickers(self) -> list[str]:
+        """Ticker Symbols held in the Table
+
+        :return: Ticker Symbols
+        :rtype: list[str]
+        """
+        return [ticker for ticker in dict.fromkeys(self.arrays["Ticker"].tolist()) if ticker != ""]
+
+    @property
+    def data(self) -> DataFrame:
+        return self.query()
+
+class ColumnarDatabase:
+    def __init__(self, databaseDirectory:str) -> None:
+        """Creates and Opens a Database of Memory Mapped Columns, an Alternative to the SQLite Database
+
+        :param databaseDirectory: Directory of the Database
+        :type databaseDirectory: str
+        """
+
+        if not self.exist(databaseDirectory):
+            self.create(databaseDirectory)
+
+        # Database Directory
+        self.databaseDirectory = databaseDirectory
+
+        # Lock of the Writes, also Held while Checking then Changing the Schema
+        self.lock = threading.RLock()
+        self.schemaLock = self.lock
+
+        # Depth of the Open Transactions, the Tables Written and the Tables Added during them
+        self.transactionDepth = 0
+        self._dirty = set()
+        self._added = []
+
+        # Opened Tables
+        self._tables = {}
+
+    @staticmethod
+    def exist(databaseDirectory:str) -> bool:
+        """Checks the Existance of the Database
+
+        :param databaseDirectory: Database Directory
+        :type databaseDirectory: str
+        :return: If the Database Exists
+        :rtype: bool
+        """
+        if databaseDirectory[-5:] != ".cols": return False
+        return path.isdir(databaseDirectory)
+
+    @staticmethod
+    def create(databaseDirectory:str) -> None:
+        """Create a Database
+
+        :param databaseDirectory: Directory of the Database
+        :type databaseDirectory: str
+        :raises TypeError: Database Already Exists
+        :raises TypeError: That is Not a Columnar Database Directory must end in '.cols'
+        """
+        if ColumnarDatabase.exist(databaseDirectory): raise TypeError("Database Already Exists")
+
+        if databaseDirectory[-5:] != ".cols": raise TypeError("That is Not a Columnar Database Directory must end in '.cols' ")
+
+        makedirs(databaseDirectory)
+
+    @staticmethod
+    def delete(databaseDirectory:str) -> None:
+        """Delete the Database
+
+        :param databaseDirectory: Database Directory
+        :type databaseDirectory: str
+        :raises TypeError: Database Does Not Exist or Wrong Directory
+        """
+        if ColumnarDatabase.exist(databaseDirectory):
+            rmtree(databaseDirectory)
+        else:
+            raise TypeError("Database Does Not Exist or Wrong Directory")
+
+    @contextmanager
+    def transaction(self) -> Iterator["ColumnarDatabase"]:
+        """Defer Flushing the Columns and Schemas to the End, Rolling Back the Writes and Added Tables on Error
+
+        Nested Transactions join the Outermost one. Deleted Tables are Not Restored.
+
+        :return: The Database
+        :rtype: Iterator[ColumnarDatabase]
+        """
+        with self.lock:
+            self.transactionDepth += 1
+
+            try:
+                yield self
+            except BaseException:
+                self.transactionDepth -= 1
+
+                # Roll Back the Writes and the Tables Added
+                if self.transactionDepth == 0:
+                    for table in self._dirty:
+                        table._rollback()
+                    for tableName in self._added:
+                        if self.hasTable(tableName): self.deleteTable(tableName)
+                    self._dirty, self._added = set(), []
+                raise
+            else:
+                self.transactionDepth -= 1
+
+                # Flush the Tables Written
+                if self.transactionDepth == 0:
+                    for table in self._dirty:
+                        table._undo = None
+                        table._save()
+                    self._dirty, self._added = set(), []
+
+    def hasTable(self, tableName:str) -> bool:
+        return ColumnarTable.exist(tableName, self.databaseDirectory)
+
+    def addTable(self, tableName:str, columns:list[Column], unique:list[str] = None) -> None:
+        """Add a Table to Database
+
+        :param tableName: Table Name
+        :type tableName: str
+        :param columns: Columns to add to the Table
+        :type columns: list[Column]
+        :param unique: Column Names that together Key each Row
+        :type unique: list[str]
+        :raises TypeError: Table Already Exists
+        """
+        with self.lock:
+            ColumnarTable.create(tableName, columns, self.databaseDirectory, unique)
+            if self.transactionDepth > 0: self._added.append(tableName)
+
+    def deleteTable(self, tableName:str) -> None:
+        """Delete the Table
+
+        :param tableName: Table Name
+        :type tableName: str
+        :raises TypeError: Table Does Not Exist
+        """
+        with self.lock:
+            self._tables.pop(tableName, None)
+            ColumnarTable.delete(tableName, self.databaseDirectory)
+
+    def getTable(self, tableName:str) -> ColumnarTable:
+
+        if not self.hasTable(tableName): raise TypeError("Table Does Not Exist")
+
+        with self.lock:
+            if tableName not in self._tables:
+                self._tables[tableName] = ColumnarTable(tableName, self)
+
+            return self._tables[tableName]
+
+    @property
+    def tables(self) -> list[ColumnarTable]:
+        """Tables that are held in the Database
+
+        :return: List of Tables in the Database
+        :rtype: list[ColumnarTable]
+        """
+        return [self.getTable(name) for name in sorted(listdir(self.databaseDirectory)) if self.hasTable(name)]
+
+    def close(self) -> None:
+        """Flush and Close every Table
+        """
+        with self.lock:
+            for table in self._tables.values():
+                table._save()
+                table._saveOrder()
+
+            self._tables = {}
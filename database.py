@@ -1,10 +1,52 @@
+from __future__ import annotations
+import logging
 import sqlite3 
-from pandas import DataFrame, read_sql_query
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Callable, Iterator, Union
+from metrics import Metrics
 
+# Pandas is Only Imported when a DataFrame is Asked for, so Writing Rows Needs Only the Standard Library
+if TYPE_CHECKING:
+    from pandas import DataFrame
 
 
 
 
+
+# Pragmas of every Database Connection, WAL lets Readers run while One Thread Writes
+PRAGMAS = {"journal_mode":"WAL", "synchronous":"NORMAL", "cache_size":-65536, "mmap_size":268435456, "temp_store":"MEMORY"}
+
+# Metrics of Tables Opened on a Connection instead of a Database, Never Recorded
+_UNRECORDED = Metrics(enabled=False)
+
+# Table of the Change Feed, a Sequence Number for each Row Inserted or Updated in a Watched Table
+CHANGES = "Changes"
+
+class Connection(sqlite3.Connection):
+    def __init__(self, *args, **kwargs) -> None:
+        """SQLite Connection that Defers Commits while a Transaction is Open
+        """
+        super().__init__(*args, **kwargs)
+        
+        # Depth of the Open Transactions
+        self.transactionDepth = 0
+        
+    def commit(self) -> None:
+        """Commit unless a Transaction is Open, the Transaction Commits at its End
+        """
+        if self.transactionDepth == 0:
+            super().commit()
+            
+    def __exit__(self, *args) -> bool:
+        
+        # Leave Committing or Rolling Back to the Open Transaction
+        if self.transactionDepth > 0:
+            return False
+        
+        return super().__exit__(*args)
+
 class Column:
     def __init__(self, columnName:str, dtype:type, **kwargs) -> None:
         """Column for SQLite Table Database
@@ -51,19 +93,31 @@ class Column:
         return f"{self.name} {self._convertType(self.dtype)}"
 
 class Table:
-    def __init__(self, tableName:str,databaseConnection:sqlite3.Connection) -> None:
+    def __init__(self, tableName:str,databaseConnection:Union[sqlite3.Connection,"Database"]) -> None:
         """Table from SQLite Database
 
         :param tableName: Table Name
         :type tableName: str
-        :param databaseConnection: Connection to the Database
-        :type databaseConnection: sqlite3.Connection
+        :param databaseConnection: Connection to the Database, or the Database to take each Thread's Connection from
+        :type databaseConnection: Union[sqlite3.Connection,Database]
         """
         # Table Name
         self.name = tableName
         
-        # Database Connection
-        self.connection = databaseConnection
+        # Database Connection or Database
+        self._connection = databaseConnection
+        
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Connection to the Database for the Current Thread
+
+        :return: Database Connection
+        :rtype: sqlite3.Connection
+        """
+        if isinstance(self._connection, Database):
+            return self._connection.connection
+        
+        return self._connection
         
     @staticmethod
     def exist(tableName:str, databaseConnection:sqlite3.Connection) -> bool:
@@ -79,7 +133,7 @@ class Table:
         return databaseConnection.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{tableName}';").fetchone() is not None
     
     @staticmethod
-    def create(tableName:str, columns:list[Column], databaseConnection:sqlite3.Connection) -> None:
+    def create(tableName:str, columns:list[Column], databaseConnection:sqlite3.Connection, unique:list[str] = None) -> None:
         """Create a Table in the Database
 
         :param tableName: Table Name
@@ -88,6 +142,8 @@ class Table:
         :type columns: list[Column]
         :param databaseConnection: Connect to Database
         :type databaseConnection: sqlite3.Connection
+        :param unique: Column Names that together Key each Row, Indexed as Unique
+        :type unique: list[str]
         :raises TypeError: Table Already Exists
         """
         
@@ -106,6 +162,11 @@ class Table:
         sql += ") ;"
         # Creating Tables
         databaseConnection.execute(sql)
+        
+        # Creating the Unique Index of the Key
+        if unique:
+            Table(tableName, databaseConnection).addIndex(unique, unique=True)
+        
         databaseConnection.commit()
 
     @staticmethod
@@ -132,18 +193,471 @@ class Table:
         :param df: The Updated DataFrame
         :type df: DataFrame
         """
-        df.to_sql(self.name,self.connection, if_exists='replace', index = False)
-   
+        # Replacing the Table Drops its Triggers, so a Watched Table is Watched again
+        watched = isinstance(self._connection, Database) and self._connection.isWatched(self.name)
+        
+        with self._span("update") as span:
+            df.to_sql(self.name,self.connection, if_exists='replace', index = False)
+            span.rows, span.bytes = len(df), int(df.memory_usage(index=False).sum())
+        
+        # Replacing the Table Drops its Indexes and can Change its Columns
+        self._schemaChanged()
+        if watched:
+            self._connection.watch(self.name, existing=True)
+        self._written()
+
+    def _span(self, operation:str):
+        """Time an Operation on the Table in the Metrics of the Database
+
+        :param operation: Operation Name
+        :type operation: str
+        :return: Context Manager of the Span
+        :rtype: ContextManager[Span]
+        """
+        metrics = self._connection.metrics if isinstance(self._connection, Database) else _UNRECORDED
+        
+        return metrics.span(operation, self.name)
+
+    def _written(self) -> None:
+        """Invalidate the Cached Reads of the Table after Writing to it
+        """
+        if isinstance(self._connection, Database):
+            self._connection._written(self.name)
+
+    def _read(self, operation:str, sql:str, parameters:list = None) -> DataFrame:
+        """Read a Select into a DataFrame, through the Read Cache of the Database
+
+        :param operation: Operation Name
+        :type operation: str
+        :param sql: SQL Code of the Select
+        :type sql: str
+        :param parameters: Parameters of the Select
+        :type parameters: list
+        :return: Selected Rows
+        :rtype: DataFrame
+        """
+        def read() -> DataFrame:
+            from pandas import read_sql_query
+            
+            with self._span(operation) as span:
+                df = read_sql_query(sql, self.connection, params=parameters)
+                span.rows, span.bytes = len(df), int(df.memory_usage(index=False).sum())
+            
+            return df
+        
+        if isinstance(self._connection, Database):
+            return self._connection._cachedRead(self.name, sql, parameters, read)
+        
+        return read()
+
+    @property
+    def _schemaLock(self) -> Union[threading.RLock, nullcontext]:
+        """Lock of the Schema of the Database, Nothing to Lock on a Connection
+
+        :return: Context Manager of the Lock
+        :rtype: Union[threading.RLock, nullcontext]
+        """
+        return self._connection.schemaLock if isinstance(self._connection, Database) else nullcontext()
+
+    def _schemaChanged(self) -> None:
+        """Invalidate the Schema Catalog of the Database after Changing the Table
+        """
+        if isinstance(self._connection, Database):
+            self._connection.invalidateCatalog()
+
+    def addColumn(self, column:Column) -> None:
+        """Add a Column to the Table in Place
+
+        :param column: Column to add to the Table
+        :type column: Column
+        :raises TypeError: Column Already Exists
+        """
+
+        # One Thread at a Time Checks and Changes the Schema
+        with self._schemaLock:
+            # Check to see if the Column Exists
+            if column.name in self.columns: raise TypeError(f"{column.name} Column Already Exists")
+
+            # Adding the Column
+            try:
+                with self._span("ddl"):
+                    self.connection.execute(f"ALTER TABLE {self.name} ADD COLUMN {column.sql};")
+                    self.connection.commit()
+            except sqlite3.OperationalError as error:
+            
+                # Another Connection Added the Column since the Catalog was Loaded
+                self._schemaChanged()
+                if "duplicate column name" in str(error) and column.name in self.columns: raise TypeError(f"{column.name} Column Already Exists") from None
+                raise
+            self._schemaChanged()
+            self._written()
+
+    def addIndex(self, columns:list[str], unique:bool = False) -> None:
+        """Index Columns of the Table if they are not Indexed Already
+
+        :param columns: Column Names to Index together
+        :type columns: list[str]
+        :param unique: If the Index is Unique
+        :type unique: bool
+        """
+        
+        # Index Name
+        name = f"{self.name}_{'_'.join(columns)}"
+        
+        # Skip the Statement when the Catalog has the Index
+        if isinstance(self._connection, Database) and name in self._connection.catalog.get(self.name, {}).get("indexes", ()):
+            return
+        
+        with self._schemaLock:
+            try:
+                with self._span("ddl"):
+                    self.connection.execute(f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {name} ON {self.name} ({', '.join(columns)});")
+                    self.connection.commit()
+            except sqlite3.OperationalError as error:
+            
+                # Another Connection Changed the Schema since the Catalog was Loaded, the Index is there when it Already Exists
+                self._schemaChanged()
+                if "already exists" not in str(error): raise
+            self._schemaChanged()
+
+    def upsert(self, row:dict, key:Union[str,list[str]] = "Date") -> None:
+        """Insert the Row or Update the Row with the same Key
+
+        :param row: Column Names and Values of the Row
+        :type row: dict
+        :param key: Column Name or Names the Row is Keyed on
+        :type key: Union[str,list[str]]
+        :raises TypeError: Key Not in the Row
+        """
+        self.upsertMany([row], key)
+
+    def upsertMany(self, rows:list[dict], key:Union[str,list[str]] = "Date") -> None:
+        """Insert the Rows or Update the Rows with the same Key without Rewriting the Table
+
+        :param rows: Column Names and Values of each Row
+        :type rows: list[dict]
+        :param key: Column Name or Names the Rows are Keyed on
+        :type key: Union[str,list[str]]
+        :raises TypeError: Key Not in the Row
+        """
+        
+        # Key Column Names
+        keys = [key] if isinstance(key, str) else list(key)
+
+        # Index the Key so each Row is a Lookup instead of a Table Scan
+        self.addIndex(keys)
+        
+        # Condition Matching the Key, IS so a Missing Ticker Matches
+        where = " AND ".join(f"{name} IS ?" for name in keys)
+
+        with self._span("upsert") as span:
+            span.rows = len(rows)
+            
+            # Connection of this Thread
+            connection = self.connection
+            
+            for row in rows:
+                for name in keys:
+                    if name not in row: raise TypeError(f"{name} Not in the Row")
+
+                # Columns to Update
+                columns = [name for name in row if name not in keys]
+
+                # Update the Row if the Key Exists
+                if columns:
+                    found = connection.execute(
+                        f"UPDATE {self.name} SET {', '.join(f'{name} = ?' for name in columns)} WHERE {where};",
+                        [row[name] for name in columns] + [row[name] for name in keys]
+                    ).rowcount > 0
+                else:
+                    found = connection.execute(f"SELECT 1 FROM {self.name} WHERE {where} LIMIT 1;", [row[name] for name in keys]).fetchone() is not None
+
+                # Insert the Row if the Key Does Not Exist
+                if not found:
+                    connection.execute(
+                        f"INSERT INTO {self.name} ({', '.join(row)}) VALUES ({', '.join('?' for _ in row)});",
+                        list(row.values())
+                    )
+
+            connection.commit()
+        
+        self._written()
+
+    def upsertValues(self, columns:list[str], values:list[tuple], key:Union[str,list[str]] = "Date") -> None:
+        """Insert or Update Rows of the same Columns with One Batched Update and One Batched Insert
+
+        Rows with a Key Repeated in the Values are Written Once, the Last One Winning.
+
+        :param columns: Column Names of the Values
+        :type columns: list[str]
+        :param values: Values of each Row in the Order of the Columns
+        :type values: list[tuple]
+        :param key: Column Name or Names the Rows are Keyed on
+        :type key: Union[str,list[str]]
+        :raises TypeError: Key Not in the Columns
+        """
+
+        # Key Column Names and their Positions in the Values
+        keys = [key] if isinstance(key, str) else list(key)
+        for name in keys:
+            if name not in columns: raise TypeError(f"{name} Not in the Columns")
+        positions = [columns.index(name) for name in keys]
+
+        # Last Row of each Key, as One Batched Update would Leave the First Row Inserted
+        values = list({tuple(row[position] for position in positions):row for row in values}.values())
+
+        # Columns to Update and their Positions in the Values
+        updates = [position for position, name in enumerate(columns) if name not in keys]
+
+        # Index the Key so each Row is a Lookup instead of a Table Scan
+        self.addIndex(keys)
+
+        # Condition Matching the Key, IS so a Missing Ticker Matches
+        where = " AND ".join(f"{name} IS ?" for name in keys)
+
+        with self._span("upsert") as span:
+            span.rows = len(values)
+
+            # Connection of this Thread
+            connection = self.connection
+
+            # Update the Rows whose Key Exists
+            if updates:
+                connection.executemany(
+                    f"UPDATE {self.name} SET {', '.join(f'{columns[position]} = ?' for position in updates)} WHERE {where};",
+                    ([row[position] for position in updates + positions] for row in values)
+                )
+
+            # Insert the Rows whose Key Does Not Exist
+            connection.executemany(
+                f"INSERT INTO {self.name} ({', '.join(columns)}) SELECT {', '.join('?' for _ in columns)} WHERE NOT EXISTS (SELECT 1 FROM {self.name} WHERE {where});",
+                ([*row, *[row[position] for position in positions]] for row in values)
+            )
+
+            connection.commit()
+
+        self._written()
+
+    @property
+    def columns(self) -> list[str]:
+        """Column Names of the Table
+
+        :return: Column Names
+        :rtype: list[str]
+        """
+        if isinstance(self._connection, Database):
+            return list(self._connection.catalog[self.name]["columns"])
+        
+        return [info[1] for info in self.connection.execute(f"PRAGMA table_info({self.name});").fetchall()]
+
+    def _select(self, columns:list[str] = None, where:dict = None, start:str = None, end:str = None, limit:int = None) -> tuple[str, list]:
+        """Build a Parameterized Select of the Table
+
+        :param columns: Column Names to Select, all when None
+        :type columns: list[str]
+        :param where: Column Names and the Value each must Equal
+        :type where: dict
+        :param start: First Date to Select
+        :type start: str
+        :param end: Last Date to Select
+        :type end: str
+        :param limit: Most Rows to Select
+        :type limit: int
+        :return: SQL Code and its Parameters
+        :rtype: tuple[str, list]
+        """
+        
+        # Conditions and their Parameters
+        conditions, parameters = [], []
+        
+        # IS for a Missing Value so None Matches NULL, as the Upserts Match Keys
+        for name, value in (where or {}).items():
+            conditions.append(f"{name} IS ?" if value is None else f"{name} = ?")
+            parameters.append(value)
+        
+        if start is not None:
+            conditions.append("Date >= ?")
+            parameters.append(start)
+            
+        if end is not None:
+            conditions.append("Date <= ?")
+            parameters.append(end)
+        
+        # Creates the SQL Code
+        sql = f"SELECT {', '.join(columns) if columns else '*'} FROM {self.name}"
+        
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        
+        return sql, parameters
+
+    def query(self, columns:list[str] = None, where:dict = None, start:str = None, end:str = None, limit:int = None) -> DataFrame:
+        """Rows of the Table Filtered in SQL so only the Rows Needed are Read
+
+        :param columns: Column Names to Select, all when None
+        :type columns: list[str]
+        :param where: Column Names and the Value each must Equal
+        :type where: dict
+        :param start: First Date to Select
+        :type start: str
+        :param end: Last Date to Select
+        :type end: str
+        :param limit: Most Rows to Select
+        :type limit: int
+        :return: Selected Rows
+        :rtype: DataFrame
+        """
+        sql, parameters = self._select(columns, where, start, end, limit)
+        
+        return self._read("query", sql, parameters)
+
+    def stream(self, chunkSize:int = 10000, columns:list[str] = None, where:dict = None, start:str = None, end:str = None, records:bool = False) -> Iterator[Union[DataFrame, list[tuple]]]:
+        """Rows of the Table in Chunks so Memory stays Bounded by the Chunk Size
+
+        :param chunkSize: Most Rows in each Chunk
+        :type chunkSize: int
+        :param columns: Column Names to Select, all when None
+        :type columns: list[str]
+        :param where: Column Names and the Value each must Equal
+        :type where: dict
+        :param start: First Date to Select
+        :type start: str
+        :param end: Last Date to Select
+        :type end: str
+        :param records: Yield Lists of Row Tuples instead of DataFrames
+        :type records: bool
+        :raises TypeError: Chunk Size Must be Positive
+        :return: Chunks of Rows
+        :rtype: Iterator[Union[DataFrame, list[tuple]]]
+        """
+        if chunkSize < 1: raise TypeError("Chunk Size Must be Positive")
+        if not records:
+            from pandas import DataFrame
+        
+        sql, parameters = self._select(columns, where, start, end)
+        
+        # Cursor of the Select
+        cursor = self.connection.cursor()
+        
+        try:
+            cursor.execute(sql, parameters)
+            
+            # Column Names of the Chunks
+            names = [description[0] for description in cursor.description]
+            
+            while True:
+                with self._span("stream") as span:
+                    rows = cursor.fetchmany(chunkSize)
+                    span.rows = len(rows)
+                if not rows: break
+                
+                yield rows if records else DataFrame.from_records(rows, columns=names)
+        finally:
+            cursor.close()
+
+    def asOf(self, dates:Union[str, list[str]], columns:list[str] = None, where:dict = None, by:str = "Ticker") -> DataFrame:
+        """Latest Row at or before each Date, so a Backtest on a Date Only Sees what was Known then
+
+        The Rows up to the Last Date are Read once through the Date Index, then each Date
+        is Matched to its Latest Row by Binary Search.
+
+        :param dates: Date or Dates to Look Back from
+        :type dates: Union[str, list[str]]
+        :param columns: Column Names to Select, all when None
+        :type columns: list[str]
+        :param where: Column Names and the Value each must Equal
+        :type where: dict
+        :param by: Column Name to find the Latest Row of each Value of, e.g. each Ticker, Missing Values as One more Value, the Latest Row of the Table when None or Not in the Table
+        :type by: str
+        :return: AsOf Date and the Latest Row of each Date and Value of By, in the Order of the Dates, Dates with No Row Before them Left Out
+        :rtype: DataFrame
+        """
+        from pandas import DataFrame, factorize, merge_asof, to_datetime
+        
+        dates = [dates] if isinstance(dates, str) else list(dates)
+        
+        # Group Only by a Column the Table Has
+        if by is not None and by not in self.columns:
+            by = None
+        
+        # Index the Date so Reading up to the Last Date Skips the Later Rows
+        self.addIndex(["Date"])
+        
+        # Rows up to the Last Date, with the Date and By Columns
+        if columns:
+            columns = list(dict.fromkeys(["Date", *([by] if by else []), *columns]))
+        data = self.query(columns, where, end=max(dates)) if dates else self.query(columns, where, limit=0)
+        
+        # Rows by Date, each Value of By as a Group Number so Missing Values are a Group too
+        data = data.assign(_date=to_datetime(data["Date"]).astype("datetime64[s]"))
+        if by is not None:
+            groups, values = factorize(data[by], use_na_sentinel=False)
+            data = data.assign(_group=groups)
+        data = data.sort_values("_date", kind="stable")
+        
+        # Each Date, for each Group of By
+        left = DataFrame({"AsOf":dates, "_asOf":to_datetime(dates).astype("datetime64[s]"), "_order":range(len(dates))})
+        if by is not None:
+            left = left.merge(DataFrame({"_group":range(len(values))}), how="cross")
+        left = left.sort_values("_asOf", kind="stable")
+        
+        # Latest Row at or before each Date
+        result = merge_asof(left, data, left_on="_asOf", right_on="_date", by="_group" if by else None, direction="backward")
+        result = result[result["_date"].notna()].sort_values(["_order", *([by] if by else [])], kind="stable")
+        if by is not None:
+            result[by] = result[by].astype(object).where(result[by].notna(), None)
+        
+        return result.drop(columns=["_asOf", "_order", "_date", *(["_group"] if by else [])]).reset_index(drop=True)
+
+    def inserted(self, since:int = 0) -> DataFrame:
+        """Rows Inserted after a Row Id, Rows Updated in Place Keep their Row Id
+
+        :param since: Row Id the Rows are after
+        :type since: int
+        :return: Row Id of each Row as RowId and the Row, in the Order they were Inserted
+        :rtype: DataFrame
+        """
+        return self._read("inserted", f"SELECT rowid AS RowId, * FROM {self.name} WHERE rowid > ? ORDER BY rowid", [since])
+
+    def tickerData(self, ticker:str) -> DataFrame:
+        """Rows of a Single Ticker
+
+        :param ticker: Ticker Symbol
+        :type ticker: str
+        :return: Rows of the Ticker
+        :rtype: DataFrame
+        """
+        return self.query(where={"Ticker":ticker})
+
+    @property
+    def tickers(self) -> list[str]:
+        """Ticker Symbols held in the Table
+
+        :return: Ticker Symbols
+        :rtype: list[str]
+        """
+        return [ticker[0] for ticker in self.connection.execute(f"SELECT DISTINCT Ticker FROM {self.name} WHERE Ticker IS NOT NULL;").fetchall()]
+
     @property
     def data(self) -> DataFrame:
-        return read_sql_query(f"SELECT * FROM {self.name}", self.connection)
+        return self._read("data", f"SELECT * FROM {self.name}")
    
 class Database:
-    def __init__(self, databaseDirectory:str) -> None:
+    def __init__(self, databaseDirectory:str, pragmas:dict = None, metrics:bool = True, cacheSize:int = 0) -> None:
         """Creates and Opens Database
 
         :param databaseDirectory: Directory of the Database
         :type databaseDirectory: str
+        :param pragmas: Pragmas to Override on every Connection
+        :type pragmas: dict
+        :param metrics: If the Operations on the Database are Recorded in its Metrics
+        :type metrics: bool
+        :param cacheSize: Most Table Reads Cached, Off when 0. Writes from other Processes are Not Seen until invalidateCache
+        :type cacheSize: int
         """
      
         if not self.exist(databaseDirectory):
@@ -152,8 +666,177 @@ class Database:
         # Database Directory
         self.databaseDirectory = databaseDirectory
         
-        # Database Connection
-        self.connection = sqlite3.connect(self.databaseDirectory,timeout=8)
+        # Pragmas of every Connection
+        self.pragmas = {**PRAGMAS, **(pragmas or {})}
+        
+        # Connection of each Thread, by Thread
+        self._local = threading.local()
+        self._connections = {}
+        self._lock = threading.Lock()
+        
+        # Lock Held while Checking then Changing the Schema, so Threads Do Not Add the same Table or Column
+        self.schemaLock = threading.RLock()
+        
+        # Schema Catalog, Loaded on First Use
+        self._catalog = None
+        
+        # Counts, Rows, Bytes and Latencies of the Operations
+        self.metrics = Metrics(enabled=metrics)
+        
+        # Least Recently Used Cache of the Table Reads, Valid while the Generation of their Table is Unchanged
+        self.cacheSize = cacheSize
+        self._cache = OrderedDict()
+        self._cacheLock = threading.Lock()
+        self._epoch = 0
+        self._generations = {}
+        
+        # Functions Called with the Changes of a Watched Table and the Last Sequence Number each was Sent
+        self._subscriptions = {}
+        self._subscriptionLock = threading.Lock()
+        
+        # Open the Connection of this Thread
+        self.connection
+        
+    @property
+    def connection(self) -> Connection:
+        """Connection to the Database for the Current Thread, Opened on First Use, Closing the Connections of Threads that have Ended
+
+        :return: Database Connection
+        :rtype: Connection
+        """
+        connection = getattr(self._local, "connection", None)
+        
+        if connection is None:
+            
+            # Opening the Connection, each Thread only Uses its Own
+            connection = sqlite3.connect(self.databaseDirectory,timeout=8,factory=Connection,check_same_thread=False)
+            
+            # Tuning the Connection
+            for name, value in self.pragmas.items():
+                connection.execute(f"PRAGMA {name} = {value};")
+            
+            self._local.connection = connection
+            with self._lock:
+                
+                # Connections of Ended Threads are Never Used again
+                for thread in [thread for thread in self._connections if not thread.is_alive()]:
+                    self._connections.pop(thread).close()
+                
+                self._connections[threading.current_thread()] = connection
+            
+        return connection
+    
+    @property
+    def catalog(self) -> dict[str, dict]:
+        """Schema Catalog of the Database, Cached until a Table, Column or Index is Added or Deleted through it
+
+        :return: Table Names and their "columns" (Column Names and Types), "indexes" (Index Names) and "triggers" (Trigger Names)
+        :rtype: dict[str, dict]
+        """
+        catalog = self._catalog
+        
+        if catalog is None:
+            with self.metrics.span("catalog") as span:
+                connection = self.connection
+                catalog = {}
+            
+                # Columns of each Table
+                for (name,) in connection.execute("SELECT name FROM sqlite_master WHERE type='table';").fetchall():
+                    catalog[name] = {"columns":{info[1]:info[2] for info in connection.execute(f"PRAGMA table_info({name});").fetchall()}, "indexes":set(), "triggers":set()}
+            
+                # Indexes and Triggers of each Table
+                for kind, name, tableName in connection.execute("SELECT type, name, tbl_name FROM sqlite_master WHERE type IN ('index', 'trigger');").fetchall():
+                    if tableName in catalog:
+                        catalog[tableName]["indexes" if kind == "index" else "triggers"].add(name)
+            
+                span.rows = len(catalog)
+            
+            self._catalog = catalog
+            
+        return catalog
+    
+    def _written(self, tableName:str) -> None:
+        """Move the Table to its Next Generation, Invalidating its Cached Reads
+
+        :param tableName: Table Name
+        :type tableName: str
+        """
+        with self._cacheLock:
+            self._generations[tableName] = self._generations.get(tableName, 0) + 1
+        
+        # Send the Changes to the Subscribers, once Committed when in a Transaction
+        if tableName in self._subscriptions and not self.connection.in_transaction:
+            self._notify(tableName)
+
+    def _cachedRead(self, tableName:str, sql:str, parameters:list, read:Callable[[], DataFrame]) -> DataFrame:
+        """Read through the Cache, Returning a Copy so Callers can not Change the Cached DataFrame
+
+        :param tableName: Table Name
+        :type tableName: str
+        :param sql: SQL Code of the Select
+        :type sql: str
+        :param parameters: Parameters of the Select
+        :type parameters: list
+        :param read: Function Reading the Select from the Database
+        :type read: Callable[[], DataFrame]
+        :return: Selected Rows
+        :rtype: DataFrame
+        """
+        # Reads in an Open Transaction can See its Uncommitted Writes, so Bypass the Cache
+        if self.cacheSize <= 0 or self.connection.in_transaction: return read()
+        
+        key = (tableName, sql, tuple(parameters or ()))
+        
+        with self._cacheLock:
+            generation = (self._epoch, self._generations.get(tableName, 0))
+            entry = self._cache.get(key)
+            
+            if entry is not None and entry[0] == generation:
+                self._cache.move_to_end(key)
+                df = entry[1]
+            else:
+                df = None
+        
+        if df is not None:
+            with self.metrics.span("cacheHit", tableName) as span:
+                span.rows = len(df)
+                return df.copy()
+        
+        df = read()
+        
+        with self._cacheLock:
+            
+            # Only Cache the Read if No Write Happened during it
+            if generation == (self._epoch, self._generations.get(tableName, 0)):
+                self._cache[key] = (generation, df)
+                self._cache.move_to_end(key)
+                
+                while len(self._cache) > self.cacheSize:
+                    self._cache.popitem(last=False)
+        
+        return df.copy()
+
+    def invalidateCache(self) -> None:
+        """Drop every Cached Read, Needed after another Process Writes to the Database
+        """
+        with self._cacheLock:
+            self._epoch += 1
+            self._cache.clear()
+
+    def invalidateCatalog(self) -> None:
+        """Reload the Schema Catalog on Next Use, Needed after another Process Changes the Schema
+        """
+        self._catalog = None
+    
+    def close(self) -> None:
+        """Close the Connection of every Thread, Threads Reopen their Connection on Next Use
+        """
+        with self._lock:
+            for connection in self._connections.values():
+                connection.close()
+            
+            self._connections = {}
+            self._local = threading.local()
         
     @staticmethod
     def exist(databaseDirectory:str) -> bool:
@@ -204,21 +887,156 @@ class Database:
         else:
             raise TypeError("Database Does Not Exist or Wrong Directory")
     
-    def addTable(self, tableName:str, columns:list[Column] ) -> None:
+    @contextmanager
+    def transaction(self) -> Iterator["Database"]:
+        """Group every Write into a Single Transaction with One Commit at the End
+
+        Nested Transactions join the Outermost one. Any Error Rolls Back every Write
+        made since the Outermost Transaction Started.
+
+        :return: The Database
+        :rtype: Iterator[Database]
+        """
+        
+        # Connection of this Thread
+        connection = self.connection
+        
+        # Start the Transaction
+        if connection.transactionDepth == 0 and not connection.in_transaction:
+            connection.execute("BEGIN IMMEDIATE;")
+        connection.transactionDepth += 1
+        
+        try:
+            yield self
+        except BaseException:
+            connection.transactionDepth -= 1
+            
+            # Roll Back the Writes, and any Tables, Columns or Indexes Added
+            if connection.transactionDepth == 0:
+                with self.metrics.span("rollback"):
+                    connection.rollback()
+                self.invalidateCatalog()
+                self.invalidateCache()
+            raise
+        else:
+            connection.transactionDepth -= 1
+            
+            # Commit the Writes
+            if connection.transactionDepth == 0:
+                with self.metrics.span("commit"):
+                    connection.commit()
+                self.invalidateCache()
+                self.poll()
+
+    def backup(self, targetDirectory:str, pages:int = 1024, progress:Callable[[int, int, int], None] = None, sleep:float = 0.25) -> None:
+        """Copy the Database while it is in Use, a Number of Pages at a Time so Writers are Not Starved
+
+        The Copy is a Snapshot of the Database when the Backup Started, Writes made
+        during the Backup go on in the Write-Ahead Log and are Not Copied.
+
+        :param targetDirectory: Directory of the Copy, must end in '.db'
+        :type targetDirectory: str
+        :param pages: Pages Copied in each Step, every Page in One Step when -1
+        :type pages: int
+        :param progress: Function Called after each Step with the Status, Pages Remaining and Total Pages
+        :type progress: Callable[[int, int, int], None]
+        :param sleep: Seconds to Wait before Retrying a Step while the Database is Locked
+        :type sleep: float
+        :raises TypeError: Database Already Exists
+        :raises TypeError: That is Not a Database File must end in '.db'
+        """
+        if Database.exist(targetDirectory): raise TypeError("Database Already Exists")
+        if targetDirectory[-3:] != ".db": raise TypeError("That is Not a Database File must end in '.db' ")
+
+        # Connections of the Backup, apart from the Threads' so their Transactions are Not Held
+        source = sqlite3.connect(self.databaseDirectory, timeout=8)
+        target = sqlite3.connect(targetDirectory)
+
+        try:
+            with self.metrics.span("backup") as span:
+
+                # Read Transaction Fixing the Snapshot, so Writes during the Backup Do Not Restart it
+                source.execute("BEGIN;")
+                source.execute("SELECT 1 FROM sqlite_master LIMIT 1;").fetchall()
+
+                source.backup(target, pages=pages, progress=progress, sleep=sleep)
+                source.rollback()
+
+                span.rows = target.execute("PRAGMA page_count;").fetchone()[0]
+                span.bytes = span.rows*target.execute("PRAGMA page_size;").fetchone()[0]
+        finally:
+            target.close()
+            source.close()
+
+    def restore(self, sourceDirectory:str, pages:int = -1, progress:Callable[[int, int, int], None] = None) -> None:
+        """Replace the Database with a Backup, every Page in One Step by Default
+
+        :param sourceDirectory: Directory of the Backup
+        :type sourceDirectory: str
+        :param pages: Pages Copied in each Step, every Page in One Step when -1
+        :type pages: int
+        :param progress: Function Called after each Step with the Status, Pages Remaining and Total Pages
+        :type progress: Callable[[int, int, int], None]
+        :raises TypeError: Database Does Not Exist or Wrong Directory
+        :raises TypeError: Can Not Restore in a Transaction
+        """
+        if not Database.exist(sourceDirectory): raise TypeError("Database Does Not Exist or Wrong Directory")
+
+        # Connection of this Thread
+        connection = self.connection
+        if connection.transactionDepth > 0 or connection.in_transaction: raise TypeError("Can Not Restore in a Transaction")
+
+        source = sqlite3.connect(sourceDirectory)
+
+        try:
+            with self.metrics.span("restore") as span:
+                source.backup(connection, pages=pages, progress=progress)
+                span.rows = connection.execute("PRAGMA page_count;").fetchone()[0]
+        finally:
+            source.close()
+
+        # Every Table and the Schema can have Changed
+        self.invalidateCatalog()
+        self.invalidateCache()
+
+    def hasTable(self, tableName:str) -> bool:
+        """Checks the Tables Existance in the Database
+
+        :param tableName: Table Name
+        :type tableName: str
+        :return: If the Table Exists
+        :rtype: bool
+        """
+        return tableName in self.catalog
+    
+    def addTable(self, tableName:str, columns:list[Column], unique:list[str] = None) -> None:
         """Add a Table to Database
 
         :param tableName: Table Name
         :type tableName: str
         :param columns: Columns to add to the Table
         :type columns: list[Column]
+        :param unique: Column Names that together Key each Row, Indexed as Unique
+        :type unique: list[str]
         :raises TypeError: Table Already Exists
         """
         
-        # Check to see if the Table Exists
-        if Table.exist(tableName, self.connection): raise TypeError("Table Already Exists")
+        with self.schemaLock:
+            # Check to see if the Table Exists
+            if self.hasTable(tableName): raise TypeError("Table Already Exists")
         
-        # Create Table
-        Table.create(tableName, columns, self.connection)
+            # Create Table
+            try:
+                with self.metrics.span("ddl", tableName):
+                    Table.create(tableName, columns, self.connection, unique)
+            except (TypeError, sqlite3.OperationalError) as error:
+            
+                # Another Connection Created the Table since the Catalog was Loaded
+                self.invalidateCatalog()
+                if self.hasTable(tableName) and (isinstance(error, TypeError) or "already exists" in str(error)): raise TypeError("Table Already Exists") from None
+                raise
+            self._written(tableName)
+            self.invalidateCatalog()
         
     def deleteTable(self, tableName:str) -> None:
         """Delete the Table
@@ -227,18 +1045,204 @@ class Database:
         :type tableName: str
         :raises TypeError: Table Does Not Exist
         """
-        # Check if the Table Exists
-        if not Table.exist(tableName, self.connection): raise TypeError("Table Does Not Exist")
+        with self.schemaLock:
+            # Check if the Table Exists
+            if not self.hasTable(tableName): raise TypeError("Table Does Not Exist")
+        
+            # Delete Table
+            with self.metrics.span("ddl", tableName):
+                Table.delete(tableName,self.connection)
+            self._written(tableName)
+            self.invalidateCatalog()
         
-        # Delete Table
-        Table.delete(tableName,self.connection)
-     
     def getTable(self, tableName:str) -> Table:
         
-        if not Table.exist(tableName,self.connection): raise TypeError("Table Does Not Exist")
+        if not self.hasTable(tableName): raise TypeError("Table Does Not Exist")
         
         # Create a Table Objects
-        return Table(tableName,self.connection)
+        return Table(tableName,self)
+
+    def asOf(self, tableName:str, dates:Union[str, list[str]], columns:list[str] = None, where:dict = None, by:str = "Ticker") -> DataFrame:
+        """Latest Row of a Table at or before each Date, see Table.asOf
+
+        :param tableName: Table Name
+        :type tableName: str
+        :param dates: Date or Dates to Look Back from
+        :type dates: Union[str, list[str]]
+        :param columns: Column Names to Select, all when None
+        :type columns: list[str]
+        :param where: Column Names and the Value each must Equal
+        :type where: dict
+        :param by: Column Name to find the Latest Row of each Value of
+        :type by: str
+        :raises TypeError: Table Does Not Exist
+        :return: AsOf Date and the Latest Row of each Date and Value of By
+        :rtype: DataFrame
+        """
+        return self.getTable(tableName).asOf(dates, columns, where, by)
+
+    def watch(self, tableName:str, existing:bool = False) -> None:
+        """Record a Sequence Number in the Change Feed for each Row Inserted or Updated in the Table
+
+        Triggers Record the Changes, so Writes from any Connection or Process are in the Feed.
+        Deleted Rows are Not Recorded.
+
+        :param tableName: Table Name
+        :type tableName: str
+        :param existing: Record every Row Already in the Table as Changed
+        :type existing: bool
+        :raises TypeError: Table Does Not Exist
+        """
+        if not self.hasTable(tableName): raise TypeError("Table Does Not Exist")
+        
+        connection = self.connection
+        
+        with self.metrics.span("ddl", tableName):
+            
+            # Change Feed, Sequence Numbers are Never Reused
+            connection.execute(f"CREATE TABLE IF NOT EXISTS {CHANGES} (Sequence INTEGER PRIMARY KEY AUTOINCREMENT, TableName TEXT, RowId INTEGER);")
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {CHANGES}_TableName_Sequence ON {CHANGES} (TableName, Sequence);")
+            
+            # Triggers Recording the Row of each Insert and Update
+            for operation in ("INSERT", "UPDATE"):
+                connection.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS {tableName}_changes_{operation.lower()} AFTER {operation} ON {tableName} "
+                    f"BEGIN INSERT INTO {CHANGES} (TableName, RowId) VALUES ('{tableName}', NEW.rowid); END;"
+                )
+            
+            if existing:
+                connection.execute(f"INSERT INTO {CHANGES} (TableName, RowId) SELECT '{tableName}', rowid FROM {tableName};")
+            
+            connection.commit()
+        
+        self.invalidateCatalog()
+
+    def unwatch(self, tableName:str) -> None:
+        """Stop Recording the Changes of the Table, the Recorded Changes are Kept
+
+        :param tableName: Table Name
+        :type tableName: str
+        """
+        connection = self.connection
+        
+        with self.metrics.span("ddl", tableName):
+            for operation in ("insert", "update"):
+                connection.execute(f"DROP TRIGGER IF EXISTS {tableName}_changes_{operation};")
+            connection.commit()
+        
+        self.invalidateCatalog()
+
+    def isWatched(self, tableName:str) -> bool:
+        """Checks if the Changes of the Table are Recorded
+
+        :param tableName: Table Name
+        :type tableName: str
+        :return: If the Table is Watched
+        :rtype: bool
+        """
+        return f"{tableName}_changes_insert" in self.catalog.get(tableName, {}).get("triggers", ())
+
+    @property
+    def sequence(self) -> int:
+        """Last Sequence Number of the Change Feed
+
+        :return: Sequence Number, 0 when Nothing is Recorded
+        :rtype: int
+        """
+        if not self.hasTable(CHANGES): return 0
+        
+        return self.connection.execute(f"SELECT COALESCE(MAX(Sequence), 0) FROM {CHANGES};").fetchone()[0]
+
+    def changes(self, tableName:str, since:int = 0) -> DataFrame:
+        """Rows of a Watched Table Inserted or Updated after a Sequence Number
+
+        :param tableName: Table Name
+        :type tableName: str
+        :param since: Sequence Number the Changes are after
+        :type since: int
+        :return: Sequence Number of the Latest Change of each Row and the Row, in the Order of the Changes
+        :rtype: DataFrame
+        """
+        from pandas import DataFrame, read_sql_query
+        
+        if not self.hasTable(CHANGES): return DataFrame(columns=["Sequence", *self.catalog.get(tableName, {}).get("columns", {})])
+        
+        with self.metrics.span("changes", tableName) as span:
+            df = read_sql_query(
+                f"SELECT c.Sequence, t.* FROM (SELECT RowId, MAX(Sequence) AS Sequence FROM {CHANGES} WHERE TableName = ? AND Sequence > ? GROUP BY RowId) c "
+                f"JOIN {tableName} t ON t.rowid = c.RowId ORDER BY c.Sequence;",
+                self.connection, params=[tableName, since]
+            )
+            span.rows, span.bytes = len(df), int(df.memory_usage(index=False).sum())
+        
+        return df
+
+    def pruneChanges(self, sequence:int) -> None:
+        """Delete the Recorded Changes up to a Sequence Number, e.g. once every Consumer has Read them
+
+        :param sequence: Last Sequence Number to Delete
+        :type sequence: int
+        """
+        if not self.hasTable(CHANGES): return
+        
+        with self.metrics.span("prune", CHANGES):
+            self.connection.execute(f"DELETE FROM {CHANGES} WHERE Sequence <= ?;", [sequence])
+            self.connection.commit()
+
+    def subscribe(self, tableName:str, subscriber:Callable[[DataFrame], None], since:int = None) -> None:
+        """Call a Function with the Changes of a Watched Table after each Write through this Database and each Poll
+
+        A Subscriber Raising is Logged, so the Write that Sent the Changes still Succeeds.
+
+        :param tableName: Table Name
+        :type tableName: str
+        :param subscriber: Function Called with the Changes, as Returned by Changes
+        :type subscriber: Callable[[DataFrame], None]
+        :param since: Sequence Number the First Changes are after, the Last Sequence Number when None
+        :type since: int
+        :raises TypeError: Table is Not Watched
+        """
+        if not self.isWatched(tableName): raise TypeError(f"{tableName} Table is Not Watched")
+        
+        with self._subscriptionLock:
+            self._subscriptions.setdefault(tableName, {})[subscriber] = self.sequence if since is None else since
+
+    def unsubscribe(self, tableName:str, subscriber:Callable[[DataFrame], None]) -> None:
+        with self._subscriptionLock:
+            del self._subscriptions[tableName][subscriber]
+            if not self._subscriptions[tableName]:
+                del self._subscriptions[tableName]
+
+    def poll(self) -> None:
+        """Send the Changes of every Subscribed Table, Needed to See Writes from another Process
+        """
+        for tableName in list(self._subscriptions):
+            self._notify(tableName)
+
+    def _notify(self, tableName:str) -> None:
+        """Call the Subscribers of a Table with the Changes they have Not been Sent
+
+        :param tableName: Table Name
+        :type tableName: str
+        """
+        if not self.hasTable(tableName): return
+        
+        with self._subscriptionLock:
+            subscribers = list(self._subscriptions.get(tableName, {}).items())
+        
+        for subscriber, since in subscribers:
+            try:
+                df = self.changes(tableName, since)
+                if df.empty: continue
+                
+                # Move the Subscriber Past the Changes before Calling it, so its own Writes are New Changes
+                with self._subscriptionLock:
+                    if subscriber not in self._subscriptions.get(tableName, {}): continue
+                    self._subscriptions[tableName][subscriber] = max(self._subscriptions[tableName][subscriber], int(df["Sequence"].max()))
+                
+                subscriber(df)
+            except Exception:
+                logging.getLogger(__name__).exception(f"Subscriber {subscriber} of {tableName} Failed")
      
      
          
@@ -249,9 +1253,6 @@ class Database:
         :return: List of Tables in the Database
         :rtype: list[Table]
         """
-        # Table Names
-        tableNames = [name[0] for name in self.connection.execute("SELECT name FROM sqlite_master WHERE type='table';").fetchall()]
-        
         # Create a Table Objects
-        return [Table(name, self.connection) for name in tableNames]
+        return [Table(name, self) for name in self.catalog]
     
\ No newline at end of file
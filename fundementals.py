@@ -1,12 +1,111 @@
-from pandas import DataFrame, concat, merge
+from __future__ import annotations
 from database import Column, Database, Table
 from datetime import datetime
 from indicator import Indicator
 from abc import abstractmethod
+from typing import TYPE_CHECKING, Union
+
+# NumPy and Pandas are Only Imported for the Batch Calculations, the Percent of One Fundemental Needs Only the Standard Library
+if TYPE_CHECKING:
+    from numpy import ndarray
+    from numpy.typing import ArrayLike
+    from pandas import DataFrame
+
+def _asArray(values:ArrayLike) -> ndarray:
+    """Convert Values into a Float Array with None as NaN
+
+    :param values: Values, Array or DataFrame Column
+    :type values: ArrayLike
+    :return: Float Array
+    :rtype: ndarray
+    """
+    from numpy import asarray
+    
+    return asarray(values, dtype=float)
+
+def _divide(numerator:ArrayLike, denominator:ArrayLike) -> ndarray:
+    """Divide Element Wise with NaN where the Denominator is Zero or a Value is Missing
+
+    :param numerator: Numerator
+    :type numerator: ArrayLike
+    :param denominator: Denominator
+    :type denominator: ArrayLike
+    :return: Quotient
+    :rtype: ndarray
+    """
+    from numpy import broadcast_shapes, divide, full, isnan, nan
+    
+    numerator, denominator = _asArray(numerator), _asArray(denominator)
+    
+    # Output with NaN for every Masked Element
+    out = full(broadcast_shapes(numerator.shape, denominator.shape), nan)
+    
+    return divide(numerator, denominator, out=out, where=(denominator != 0) & ~isnan(denominator) & ~isnan(numerator))
+
+def fundementalsTable(database:Database, columns:list[Column], ticker:bool = True) -> Table:
+    """Fundementals Table with the Columns, Created Keyed by Ticker and Date if it Does Not Exist
+
+    :param database: Database of the Table
+    :type database: Database
+    :param columns: Columns the Table must Have
+    :type columns: list[Column]
+    :param ticker: If the Table must Have the Ticker Column
+    :type ticker: bool
+    :return: Fundementals Table
+    :rtype: Table
+    """
+    
+    # One Thread at a Time Checks and Changes the Schema
+    with database.schemaLock:
+        # Create the Table Keyed by Ticker and Date if the Table Does Not Exist, Another Connection may Create it First
+        if not database.hasTable("Fundementals"):
+            try:
+                database.addTable("Fundementals",[Column("Ticker",str), Column("Date",str)] + columns, unique=["Ticker","Date"])
+            except TypeError:
+                if not database.hasTable("Fundementals"): raise
+            database.getTable("Fundementals").addIndex(["Date"])
+    
+        # Get the Table
+        table = database.getTable("Fundementals")
+    
+        # Add the Columns the Table is Missing, Another Connection may Add them First
+        existing = table.columns
+        for column in ([Column("Ticker",str)] if ticker else []) + columns:
+            if column.name not in existing:
+                try:
+                    table.addColumn(column)
+                except TypeError:
+                    if column.name not in table.columns: raise
+                existing.append(column.name)
+    
+    return table
+
+def _upsertRow(database:Database, ticker:str, date:str, row:dict) -> None:
+    """Write the Inputs of a Ticker on a Date into the Fundementals Table as a Single Row
+
+    :param database: Database of the Table
+    :type database: Database
+    :param ticker: Ticker Symbol the Row Belongs to, Tables from before Tickers only get a Ticker Column when One is Given
+    :type ticker: str
+    :param date: Date of the Row, Today when None
+    :type date: str
+    :param row: Column Names and Values of the Inputs
+    :type row: dict
+    """
+    
+    # Fundementals Table with every Column of the Row
+    table = fundementalsTable(database, [Column(name, float) for name in row], ticker is not None)
+    
+    # Upsert the Row, Keyed by Date alone in Tables from before Tickers
+    row = {"Date":date or str(datetime.now().date()), **row}
+    if "Ticker" in table.columns:
+        table.upsert({"Ticker":ticker, **row}, ["Ticker","Date"])
+    else:
+        table.upsert(row)
 
 # Fundemental Indicator Class
 class Fundemental(Indicator):
-    def __init__(self, fundementalName:str, description:str, database:Database = None, **kwargs) -> None:
+    def __init__(self, fundementalName:str, description:str, database:Database = None, ticker:str = None, lazy:bool = False, **kwargs) -> None:
         
         # Name of Fundemental Indicator & Description of Fundemental Indicator
         super().__init__(fundementalName, description,kwargs=kwargs)
@@ -14,20 +113,70 @@ class Fundemental(Indicator):
         # Setting up Database
         self._db = database
         
+        # Ticker Symbol the Fundemental Belongs to
+        self._ticker = ticker
+        
+        # Lazy Fundementals Calculate on First Access and only Write to the Database on Flush
+        self._lazy = lazy
+        
     @property
     def db(self) -> Database:
         return self._db
     
+    @property
+    def ticker(self) -> str:
+        return self._ticker
+    
+    @property
+    def lazy(self) -> bool:
+        return self._lazy
+    
+    @property
+    def percent(self) -> float:
+        
+        # Calculate the Percent on First Access
+        if not hasattr(self, "_percent"):
+            self._percent = self.calculatePercent(*[getattr(self, name) for name in self.inputs])
+        
+        return self._percent
+    
+    def flush(self) -> None:
+        """Write the Fundemental to the Database, use Database.transaction to Flush many with One Commit
+
+        :raises TypeError: No Database to Flush to
+        """
+        if self.db is None: raise TypeError("No Database to Flush to")
+        
+        # Updating Database
+        self._updateDatabase()
+    
     @abstractmethod
     def _updateDatabase(self) -> None:
         pass
     
+    def _upsertDatabase(self, columns:list[Column], values:list) -> None:
+        """Write Today's Values into the Fundementals Table as a Single Row
+
+        :param columns: Columns of the Fundemental
+        :type columns: list[Column]
+        :param values: Values of the Columns
+        :type values: list
+        """
+        _upsertRow(self.db, self.ticker, None, {column.name:value for column, value in zip(columns, values)})
+    
 # Fundemental Indicators      
 class PriceToEarnings(Fundemental):
-    def __init__(self, forwardPE:float = None, trailingPE:float = None,database:Database = None, **kwargs) -> None:
+    
+    # Inputs of the Percent Calculation
+    inputs = ("forwardPE", "trailingPE")
+    
+    # Columns of the Fundementals Table the Inputs are Stored in
+    columns = ("ForwardPE", "TrailingPE")
+    
+    def __init__(self, forwardPE:float = None, trailingPE:float = None,database:Database = None, ticker:str = None, lazy:bool = False, **kwargs) -> None:
         
         # Name and Description
-        super().__init__("Price to Earnings Ratio","Description", kwargs = kwargs)
+        super().__init__("Price to Earnings Ratio","Description", database = database, ticker = ticker, lazy = lazy, kwargs = kwargs)
         
         # Database Connection
         self._db = database
@@ -38,7 +187,8 @@ class PriceToEarnings(Fundemental):
         # Trailing PE Value
         self._trailingPE = trailingPE
         
-        self._update()
+        if not self.lazy:
+            self._update()
         
     @property
     def forwardPE(self) -> float:
@@ -54,37 +204,26 @@ class PriceToEarnings(Fundemental):
         
         return 1- forwardPE/trailingPE
     
+    @staticmethod
+    def calculatePercents(forwardPE:ArrayLike, trailingPE:ArrayLike) -> ndarray:
+        """Calculate the Percent of many Values at once
+
+        :param forwardPE: forwardPE Values
+        :type forwardPE: ArrayLike
+        :param trailingPE: trailingPE Values
+        :type trailingPE: ArrayLike
+        :return: Percents, NaN where an Input is Missing or the Denominator is Zero
+        :rtype: ndarray
+        """
+        return 1 - _divide(forwardPE, trailingPE)
+ 
     def _updateDatabase(self) -> None:
         
-        # Create the Table if the Table Does Not Exist
-        if not Table.exist("Fundementals",self.db.connection):
-            self.db.addTable("Fundementals",[
-                Column("Date",str),
-                Column("TrailingPE",float),
-                Column("ForwardPE",float)
-            ])
-        
-        # Get the Table
-        table = self.db.getTable("Fundementals")
-        
-        # Get the Data from the Table
-        data = table.data
-        
-        # New Data to update the Database
-        newData = DataFrame({"Date":[str(datetime.now().date())],"TrailingPE":[self.trailingPE],"ForwardPE":[self.forwardPE]})
-        
-        if list(data.loc[data['Date'] == str(datetime.now().date())].values) != []:
-            if not set(newData.keys()).issubset(data.loc[data['Date'] == str(datetime.now().date())].columns):
-                data = merge(data, newData, on='Date')
-            else:
-                data.loc[data['Date'] == str(datetime.now().date()),newData.columns] = newData.values
-            
-        else:
-            # Add New Data to the Database
-            data = concat([data, newData], axis=0, ignore_index= True)
-        
-        # Update the Database
-        table.update(data)
+        # Upsert Today's Row into the Fundementals Table
+        self._upsertDatabase([
+            Column("TrailingPE",float),
+            Column("ForwardPE",float)
+        ], [self.trailingPE,self.forwardPE])
         
     def _update(self) -> None:
         
@@ -96,13 +235,20 @@ class PriceToEarnings(Fundemental):
             self._updateDatabase()
  
 class PriceToEarningsGrowth(Fundemental):
-    def __init__(self, peg:float = None, trailingPEG:float = None, database:Database = None, **kwargs) -> None:
+    
+    # Inputs of the Percent Calculation
+    inputs = ("peg", "trailingPEG")
+    
+    # Columns of the Fundementals Table the Inputs are Stored in
+    columns = ("PEG", "TrailingPEG")
+    
+    def __init__(self, peg:float = None, trailingPEG:float = None, database:Database = None, ticker:str = None, lazy:bool = False, **kwargs) -> None:
         
        # Database Connection
         self._db = database
         
         # Name and Description
-        super().__init__("Price to Earnings Growth", "description", kwargs = kwargs)
+        super().__init__("Price to Earnings Growth", "description", database = database, ticker = ticker, lazy = lazy, kwargs = kwargs)
         
         # PEG
         self._peg = peg
@@ -110,7 +256,8 @@ class PriceToEarningsGrowth(Fundemental):
         # Trailing PEG
         self._trailingPEG = trailingPEG
         
-        self._update()
+        if not self.lazy:
+            self._update()
     
     @property
     def peg(self) -> float:
@@ -121,41 +268,30 @@ class PriceToEarningsGrowth(Fundemental):
         return self._trailingPEG
  
     @staticmethod
-    def calculatePercent(peg:float, trailingPEG:float):
+    def calculatePercent(peg:float = None, trailingPEG:float = None):
+        if peg is None or trailingPEG is None: return None
         return 1 - peg/trailingPEG
  
+    @staticmethod
+    def calculatePercents(peg:ArrayLike, trailingPEG:ArrayLike) -> ndarray:
+        """Calculate the Percent of many Values at once
+
+        :param peg: peg Values
+        :type peg: ArrayLike
+        :param trailingPEG: trailingPEG Values
+        :type trailingPEG: ArrayLike
+        :return: Percents, NaN where an Input is Missing or the Denominator is Zero
+        :rtype: ndarray
+        """
+        return 1 - _divide(peg, trailingPEG)
+ 
     def _updateDatabase(self) -> None:
         
-        # Create the Table if the Table Does Not Exist
-        if not Table.exist("Fundementals",self.db.connection):
-            self._db.addTable("Fundementals",[
-                Column("Date",str),
-                Column("TrailingPEG",float),
-                Column("PEG",float)
-            ])
-        
-        # Get the Table
-        table = self.db.getTable("Fundementals")
-        
-        # Get the Data from the Table
-        data = table.data
-        
-        # New Data to update the Database
-        newData = DataFrame({"Date":[str(datetime.now().date())],"PEG":[self.peg],"TrailingPEG":[self.trailingPEG]})
-        
-        # Update Data
-        if list(data.loc[data['Date'] == str(datetime.now().date())].values) != []:
-            if not set(newData.keys()).issubset(data.loc[data['Date'] == str(datetime.now().date())].columns):
-                data = merge(data, newData, on='Date')
-            else:
-                data.loc[data['Date'] == str(datetime.now().date()),newData.columns] = newData.values
-            
-        else:
-            # Add New Data to the Database
-            data = concat([data, newData], axis=0, ignore_index= True)
-            
-        # Update the Database
-        table.update(data)
+        # Upsert Today's Row into the Fundementals Table
+        self._upsertDatabase([
+            Column("TrailingPEG",float),
+            Column("PEG",float)
+        ], [self.trailingPEG,self.peg])
         
     def _update(self) -> None:
         
@@ -167,13 +303,20 @@ class PriceToEarningsGrowth(Fundemental):
             self._updateDatabase()
  
 class EarningsPerShare(Fundemental):
-    def __init__(self, forwardEPS:float = None, trailingEPS:float = None, database:Database = None, **kwargs) -> None:
+    
+    # Inputs of the Percent Calculation
+    inputs = ("forwardEPS", "trailingEPS")
+    
+    # Columns of the Fundementals Table the Inputs are Stored in
+    columns = ("ForwardEPS", "TrailingEPS")
+    
+    def __init__(self, forwardEPS:float = None, trailingEPS:float = None, database:Database = None, ticker:str = None, lazy:bool = False, **kwargs) -> None:
         
         # Database Connection
         self._db = database
         
         # Name and Description
-        super().__init__("Earnings Per Share", "description", kwargs = kwargs)
+        super().__init__("Earnings Per Share", "description", database = database, ticker = ticker, lazy = lazy, kwargs = kwargs)
         
         # Forward EPS
         self._forwardEPS = forwardEPS
@@ -181,7 +324,8 @@ class EarningsPerShare(Fundemental):
         # Trailing EPS
         self._trailingEPS = trailingEPS
         
-        self._update()
+        if not self.lazy:
+            self._update()
     
     @property
     def forwardEPS(self) -> float:
@@ -196,38 +340,26 @@ class EarningsPerShare(Fundemental):
         if forwardEPS is None or trailingEPS is None: return None
         return 1 - forwardEPS/trailingEPS
  
+    @staticmethod
+    def calculatePercents(forwardEPS:ArrayLike, trailingEPS:ArrayLike) -> ndarray:
+        """Calculate the Percent of many Values at once
+
+        :param forwardEPS: forwardEPS Values
+        :type forwardEPS: ArrayLike
+        :param trailingEPS: trailingEPS Values
+        :type trailingEPS: ArrayLike
+        :return: Percents, NaN where an Input is Missing or the Denominator is Zero
+        :rtype: ndarray
+        """
+        return 1 - _divide(forwardEPS, trailingEPS)
+ 
     def _updateDatabase(self) -> None:
         
-        # Create the Table if the Table Does Not Exist
-        if not Table.exist("Fundementals",self.db.connection):
-            self._db.addTable("Fundementals",[
-                Column("Date",str),
-                Column("TrailingEPS",float),
-                Column("ForwardEPS",float)
-            ])
-        
-        # Get the Table
-        table = self.db.getTable("Fundementals")
-        
-        # Get the Data from the Table
-        data = table.data
-        
-        # New Data to update the Database
-        newData = DataFrame({"Date":[str(datetime.now().date())],"ForwardEPS":[self.forwardEPS],"TrailingEPS":[self.trailingEPS]})
-        
-        # Update Data
-        if list(data.loc[data['Date'] == str(datetime.now().date())].values) != []:
-            if not set(newData.keys()).issubset(data.loc[data['Date'] == str(datetime.now().date())].columns):
-                data = merge(data, newData, on='Date')
-            else:
-                data.loc[data['Date'] == str(datetime.now().date()),newData.columns] = newData.values
-            
-        else:
-            # Add New Data to the Database
-            data = concat([data, newData], axis=0, ignore_index= True)
-            
-        # Update the Database
-        table.update(data)
+        # Upsert Today's Row into the Fundementals Table
+        self._upsertDatabase([
+            Column("TrailingEPS",float),
+            Column("ForwardEPS",float)
+        ], [self.trailingEPS,self.forwardEPS])
         
     def _update(self) -> None:
         
@@ -239,13 +371,20 @@ class EarningsPerShare(Fundemental):
             self._updateDatabase()
  
 class FreeCashflow(Fundemental):
-    def __init__(self, freeCashflow:float = None, marketCap:float = None, database:Database = None, **kwargs) -> None:
+    
+    # Inputs of the Percent Calculation
+    inputs = ("freeCashflow", "marketCap")
+    
+    # Columns of the Fundementals Table the Inputs are Stored in
+    columns = ("FreeCashflow", "MarketCap")
+    
+    def __init__(self, freeCashflow:float = None, marketCap:float = None, database:Database = None, ticker:str = None, lazy:bool = False, **kwargs) -> None:
         
         # Database Connection
         self._db = database
         
         # Name and Description
-        super().__init__("Free Cashflow", "description", kwargs = kwargs)
+        super().__init__("Free Cashflow", "description", database = database, ticker = ticker, lazy = lazy, kwargs = kwargs)
         
         # Market Cap
         self._marketCap = marketCap
@@ -253,7 +392,8 @@ class FreeCashflow(Fundemental):
         # Free Cashflow
         self._freeCashflow = freeCashflow
         
-        self._update()
+        if not self.lazy:
+            self._update()
     
     @property
     def freeCashflow(self) -> float:
@@ -268,38 +408,26 @@ class FreeCashflow(Fundemental):
         if freeCashflow is None or marketCap is None: return None
         return 1 - freeCashflow/marketCap
     
+    @staticmethod
+    def calculatePercents(freeCashflow:ArrayLike, marketCap:ArrayLike) -> ndarray:
+        """Calculate the Percent of many Values at once
+
+        :param freeCashflow: freeCashflow Values
+        :type freeCashflow: ArrayLike
+        :param marketCap: marketCap Values
+        :type marketCap: ArrayLike
+        :return: Percents, NaN where an Input is Missing or the Denominator is Zero
+        :rtype: ndarray
+        """
+        return 1 - _divide(freeCashflow, marketCap)
+ 
     def _updateDatabase(self) -> None:
         
-        # Create the Table if the Table Does Not Exist
-        if not Table.exist("Fundementals",self.db.connection):
-            self._db.addTable("Fundementals",[
-                Column("Date",str),
-                Column("FreeCashflow",float),
-                Column("MarketCap",float)
-            ])
-        
-        # Get the Table
-        table = self.db.getTable("Fundementals")
-        
-        # Get the Data from the Table
-        data = table.data
-        
-        # New Data to update the Database
-        newData = DataFrame({"Date":[str(datetime.now().date())],"FreeCashflow":[self.freeCashflow],"MarketCap":[self.marketCap]})
-        
-        # Update Data
-        if list(data.loc[data['Date'] == str(datetime.now().date())].values) != []:
-            if not set(newData.keys()).issubset(data.loc[data['Date'] == str(datetime.now().date())].columns):
-                data = merge(data, newData, on='Date')
-            else:
-                data.loc[data['Date'] == str(datetime.now().date()),newData.columns] = newData.values
-            
-        else:
-            # Add New Data to the Database
-            data = concat([data, newData], axis=0, ignore_index= True)
-            
-        # Update the Database
-        table.update(data)
+        # Upsert Today's Row into the Fundementals Table
+        self._upsertDatabase([
+            Column("FreeCashflow",float),
+            Column("MarketCap",float)
+        ], [self.freeCashflow,self.marketCap])
         
     def _update(self) -> None:
         
@@ -311,18 +439,26 @@ class FreeCashflow(Fundemental):
             self._updateDatabase()
   
 class PriceToBook(Fundemental):
-    def __init__(self, pb:float = None, database:Database = None, **kwargs) -> None:
+    
+    # Inputs of the Percent Calculation
+    inputs = ("pb",)
+    
+    # Columns of the Fundementals Table the Inputs are Stored in
+    columns = ("PriceToBook",)
+    
+    def __init__(self, pb:float = None, database:Database = None, ticker:str = None, lazy:bool = False, **kwargs) -> None:
         
         # Database Connection
         self._db = database
         
         # Name and Description
-        super().__init__("Price to Book", "description", kwargs = kwargs)
+        super().__init__("Price to Book", "description", database = database, ticker = ticker, lazy = lazy, kwargs = kwargs)
         
         # Price to Book
         self._pb = pb
         
-        self._update()
+        if not self.lazy:
+            self._update()
     
     @property
     def pb(self) -> float:
@@ -333,37 +469,24 @@ class PriceToBook(Fundemental):
         if pb is None: return None
         return (1-pb)/pb
   
+    @staticmethod
+    def calculatePercents(pb:ArrayLike) -> ndarray:
+        """Calculate the Percent of many Values at once
+
+        :param pb: pb Values
+        :type pb: ArrayLike
+        :return: Percents, NaN where an Input is Missing or the Denominator is Zero
+        :rtype: ndarray
+        """
+        pb = _asArray(pb)
+        return _divide(1 - pb, pb)
+ 
     def _updateDatabase(self) -> None:
         
-        # Create the Table if the Table Does Not Exist
-        if not Table.exist("Fundementals",self.db.connection):
-            self._db.addTable("Fundementals",[
-                Column("Date",str),
-                Column("PriceToBook",float)
-            ])
-        
-        # Get the Table
-        table = self.db.getTable("Fundementals")
-        
-        # Get the Data from the Table
-        data = table.data
-        
-        # New Data to update the Database
-        newData = DataFrame({"Date":[str(datetime.now().date())],"PriceToBook":[self.pb]})
-        
-        # Update Data
-        if list(data.loc[data['Date'] == str(datetime.now().date())].values) != []:
-            if not set(newData.keys()).issubset(data.loc[data['Date'] == str(datetime.now().date())].columns):
-                data = merge(data, newData, on='Date')
-            else:
-                data.loc[data['Date'] == str(datetime.now().date()),newData.columns] = newData.values
-            
-        else:
-            # Add New Data to the Database
-            data = concat([data, newData], axis=0, ignore_index= True)
-            
-        # Update the Database
-        table.update(data)
+        # Upsert Today's Row into the Fundementals Table
+        self._upsertDatabase([
+            Column("PriceToBook",float)
+        ], [self.pb])
         
     def _update(self) -> None:
         
@@ -375,18 +498,26 @@ class PriceToBook(Fundemental):
             self._updateDatabase()
 
 class ReturnOnEquity(Fundemental):
-    def __init__(self, database:Database = None, roe:float = None, **kwargs) -> None:
+    
+    # Inputs of the Percent Calculation
+    inputs = ("roe",)
+    
+    # Columns of the Fundementals Table the Inputs are Stored in
+    columns = ("ReturnOnEquity",)
+    
+    def __init__(self, database:Database = None, roe:float = None, ticker:str = None, lazy:bool = False, **kwargs) -> None:
         
         # Database Connection
         self._db = database
         
         # Name and Description
-        super().__init__("Return on Equity", "description", kwargs=kwargs)
+        super().__init__("Return on Equity", "description", database = database, ticker = ticker, lazy = lazy, kwargs = kwargs)
         
         # Return On Equity
         self._roe = roe
         
-        self._update()
+        if not self.lazy:
+            self._update()
     
     @property
     def roe(self) -> float:
@@ -397,37 +528,24 @@ class ReturnOnEquity(Fundemental):
         if roe is None: return None
         return (10-roe)/10
  
+    @staticmethod
+    def calculatePercents(roe:ArrayLike) -> ndarray:
+        """Calculate the Percent of many Values at once
+
+        :param roe: roe Values
+        :type roe: ArrayLike
+        :return: Percents, NaN where an Input is Missing
+        :rtype: ndarray
+        """
+        roe = _asArray(roe)
+        return (10 - roe)/10
+ 
     def _updateDatabase(self) -> None:
         
-        # Create the Table if the Table Does Not Exist
-        if not Table.exist("Fundementals",self.db.connection):
-            self._db.addTable("Fundementals",[
-                Column("Date",str),
-                Column("ReturnOnEquity",float)
-            ])
-        
-        # Get the Table
-        table = self.db.getTable("Fundementals")
-        
-        # Get the Data from the Table
-        data = table.data
-        
-        # New Data to update the Database
-        newData = DataFrame({"Date":[str(datetime.now().date())],"ReturnOnEquity":[self.roe]})
-        
-        # Update Data
-        if list(data.loc[data['Date'] == str(datetime.now().date())].values) != []:
-            if not set(newData.keys()).issubset(data.loc[data['Date'] == str(datetime.now().date())].columns):
-                data = merge(data, newData, on='Date')
-            else:
-                data.loc[data['Date'] == str(datetime.now().date()),newData.columns] = newData.values
-            
-        else:
-            # Add New Data to the Database
-            data = concat([data, newData], axis=0, ignore_index= True)
-            
-        # Update the Database
-        table.update(data)
+        # Upsert Today's Row into the Fundementals Table
+        self._upsertDatabase([
+            Column("ReturnOnEquity",float)
+        ], [self.roe])
         
     def _update(self) -> None:
         
@@ -440,18 +558,26 @@ class ReturnOnEquity(Fundemental):
             self._updateDatabase()
  
 class DividendPayout(Fundemental):
-    def __init__(self, dp:float = None, database:Database = None, **kwargs) -> None:
+    
+    # Inputs of the Percent Calculation
+    inputs = ("dp",)
+    
+    # Columns of the Fundementals Table the Inputs are Stored in
+    columns = ("DividendPayout",)
+    
+    def __init__(self, dp:float = None, database:Database = None, ticker:str = None, lazy:bool = False, **kwargs) -> None:
         
         # Database Connection
         self._db = database
         
         # Name and Description
-        super().__init__("Dividend Payout", "description", kwargs = kwargs)
+        super().__init__("Dividend Payout", "description", database = database, ticker = ticker, lazy = lazy, kwargs = kwargs)
         
         # Dividend Payout
         self._dp = dp
         
-        self._update()
+        if not self.lazy:
+            self._update()
     
     @property
     def dp(self) -> float:
@@ -462,37 +588,23 @@ class DividendPayout(Fundemental):
         if dp is None: return None
         return 1/dp
  
+    @staticmethod
+    def calculatePercents(dp:ArrayLike) -> ndarray:
+        """Calculate the Percent of many Values at once
+
+        :param dp: dp Values
+        :type dp: ArrayLike
+        :return: Percents, NaN where an Input is Missing or the Denominator is Zero
+        :rtype: ndarray
+        """
+        return _divide(1, dp)
+ 
     def _updateDatabase(self) -> None:
         
-        # Create the Table if the Table Does Not Exist
-        if not Table.exist("Fundementals",self.db.connection):
-            self._db.addTable("Fundementals",[
-                Column("Date",str),
-                Column("DividendPayout",float)
-            ])
-        
-        # Get the Table
-        table = self.db.getTable("Fundementals")
-        
-        # Get the Data from the Table
-        data = table.data
-        
-        # New Data to update the Database
-        newData = DataFrame({"Date":[str(datetime.now().date())],"DividendPayout":[self.dp]})
-        
-        # Update Data
-        if list(data.loc[data['Date'] == str(datetime.now().date())].values) != []:
-            if not set(newData.keys()).issubset(data.loc[data['Date'] == str(datetime.now().date())].columns):
-                data = merge(data, newData, on='Date')
-            else:
-                data.loc[data['Date'] == str(datetime.now().date()),newData.columns] = newData.values
-            
-        else:
-            # Add New Data to the Database
-            data = concat([data, newData], axis=0, ignore_index= True)
-            
-        # Update the Database
-        table.update(data)
+        # Upsert Today's Row into the Fundementals Table
+        self._upsertDatabase([
+            Column("DividendPayout",float)
+        ], [self.dp])
         
     def _update(self) -> None:
         
@@ -504,18 +616,26 @@ class DividendPayout(Fundemental):
             self._updateDatabase()
  
 class PriceToSales(Fundemental):
-    def __init__(self, ps:float = None, database:Database = None, **kwargs) -> None:
+    
+    # Inputs of the Percent Calculation
+    inputs = ("ps",)
+    
+    # Columns of the Fundementals Table the Inputs are Stored in
+    columns = ("PriceToSales",)
+    
+    def __init__(self, ps:float = None, database:Database = None, ticker:str = None, lazy:bool = False, **kwargs) -> None:
         
         # Database Connection
         self._db = database
         
         # Name and Description
-        super().__init__("Price to Sales", "description", kwargs = kwargs)
+        super().__init__("Price to Sales", "description", database = database, ticker = ticker, lazy = lazy, kwargs = kwargs)
         
         # Price to Sales
         self._ps = ps
         
-        self._update()
+        if not self.lazy:
+            self._update()
     
     @property
     def ps(self) -> float:
@@ -526,37 +646,23 @@ class PriceToSales(Fundemental):
         if ps is None: return None
         return ps
  
+    @staticmethod
+    def calculatePercents(ps:ArrayLike) -> ndarray:
+        """Calculate the Percent of many Values at once
+
+        :param ps: ps Values
+        :type ps: ArrayLike
+        :return: Percents, NaN where an Input is Missing, a New Array so Changing it Leaves the Inputs
+        :rtype: ndarray
+        """
+        return _asArray(ps).copy()
+ 
     def _updateDatabase(self) -> None:
         
-        # Create the Table if the Table Does Not Exist
-        if not Table.exist("Fundementals",self.db.connection):
-            self._db.addTable("Fundementals",[
-                Column("Date",str),
-                Column("PriceToSales",float)
-            ])
-        
-        # Get the Table
-        table = self.db.getTable("Fundementals")
-        
-        # Get the Data from the Table
-        data = table.data
-        
-        # New Data to update the Database
-        newData = DataFrame({"Date":[str(datetime.now().date())],"PriceToSales":[self.ps]})
-        
-        # Update Data
-        if list(data.loc[data['Date'] == str(datetime.now().date())].values) != []:
-            if not set(newData.keys()).issubset(data.loc[data['Date'] == str(datetime.now().date())].columns):
-                data = merge(data, newData, on='Date')
-            else:
-                data.loc[data['Date'] == str(datetime.now().date()),newData.columns] = newData.values
-            
-        else:
-            # Add New Data to the Database
-            data = concat([data, newData], axis=0, ignore_index= True)
-            
-        # Update the Database
-        table.update(data)
+        # Upsert Today's Row into the Fundementals Table
+        self._upsertDatabase([
+            Column("PriceToSales",float)
+        ], [self.ps])
         
     def _update(self) -> None:
         
@@ -568,18 +674,26 @@ class PriceToSales(Fundemental):
             self._updateDatabase()
  
 class DividendYield(Fundemental):
-    def __init__(self, dy:float = None, database:Database = None, **kwargs) -> None:
+    
+    # Inputs of the Percent Calculation
+    inputs = ("dy",)
+    
+    # Columns of the Fundementals Table the Inputs are Stored in
+    columns = ("DividendYield",)
+    
+    def __init__(self, dy:float = None, database:Database = None, ticker:str = None, lazy:bool = False, **kwargs) -> None:
         
         # Database Connection
         self._db = database
         
         # Name and Description
-        super().__init__("Dividend Yield", "description", kwargs = kwargs)
+        super().__init__("Dividend Yield", "description", database = database, ticker = ticker, lazy = lazy, kwargs = kwargs)
         
         # Dividend Yield
         self._dy = dy
         
-        self._update()
+        if not self.lazy:
+            self._update()
     
     @property
     def dy(self) -> float:
@@ -590,37 +704,24 @@ class DividendYield(Fundemental):
         if dy is None: return None
         return 1/(1+dy)
  
+    @staticmethod
+    def calculatePercents(dy:ArrayLike) -> ndarray:
+        """Calculate the Percent of many Values at once
+
+        :param dy: dy Values
+        :type dy: ArrayLike
+        :return: Percents, NaN where an Input is Missing or the Denominator is Zero
+        :rtype: ndarray
+        """
+        dy = _asArray(dy)
+        return _divide(1, 1 + dy)
+ 
     def _updateDatabase(self) -> None:
         
-        # Create the Table if the Table Does Not Exist
-        if not Table.exist("Fundementals",self.db.connection):
-            self._db.addTable("Fundementals",[
-                Column("Date",str),
-                Column("DividendYield",float)
-            ])
-        
-        # Get the Table
-        table = self.db.getTable("Fundementals")
-        
-        # Get the Data from the Table
-        data = table.data
-        
-        # New Data to update the Database
-        newData = DataFrame({"Date":[str(datetime.now().date())],"DividendYield":[self.dy]})
-        
-        # Update Data
-        if list(data.loc[data['Date'] == str(datetime.now().date())].values) != []:
-            if not set(newData.keys()).issubset(data.loc[data['Date'] == str(datetime.now().date())].columns):
-                data = merge(data, newData, on='Date')
-            else:
-                data.loc[data['Date'] == str(datetime.now().date()),newData.columns] = newData.values
-            
-        else:
-            # Add New Data to the Database
-            data = concat([data, newData], axis=0, ignore_index= True)
-            
-        # Update the Database
-        table.update(data)
+        # Upsert Today's Row into the Fundementals Table
+        self._upsertDatabase([
+            Column("DividendYield",float)
+        ], [self.dy])
         
     def _update(self) -> None:
         
@@ -632,18 +733,26 @@ class DividendYield(Fundemental):
             self._updateDatabase()
  
 class DebtToEquity(Fundemental):
-    def __init__(self, de:float = None, database:Database = None, **kwargs) -> None:
+    
+    # Inputs of the Percent Calculation
+    inputs = ("de",)
+    
+    # Columns of the Fundementals Table the Inputs are Stored in
+    columns = ("DebtToEquity",)
+    
+    def __init__(self, de:float = None, database:Database = None, ticker:str = None, lazy:bool = False, **kwargs) -> None:
         
         # Database Connection
         self._db = database
         
         # Name and Description
-        super().__init__("Dividend Yield", "description", kwargs = kwargs)
+        super().__init__("Dividend Yield", "description", database = database, ticker = ticker, lazy = lazy, kwargs = kwargs)
         
         # Debt To Equity
         self._de = de
         
-        self._update()
+        if not self.lazy:
+            self._update()
     
     @property
     def de(self) -> float:
@@ -654,37 +763,24 @@ class DebtToEquity(Fundemental):
         if de is None: return None
         return 1/(1+de)
  
+    @staticmethod
+    def calculatePercents(de:ArrayLike) -> ndarray:
+        """Calculate the Percent of many Values at once
+
+        :param de: de Values
+        :type de: ArrayLike
+        :return: Percents, NaN where an Input is Missing or the Denominator is Zero
+        :rtype: ndarray
+        """
+        de = _asArray(de)
+        return _divide(1, 1 + de)
+ 
     def _updateDatabase(self) -> None:
         
-        # Create the Table if the Table Does Not Exist
-        if not Table.exist("Fundementals",self.db.connection):
-            self._db.addTable("Fundementals",[
-                Column("Date",str),
-                Column("DebtToEquity",float)
-            ])
-        
-        # Get the Table
-        table = self.db.getTable("Fundementals")
-        
-        # Get the Data from the Table
-        data = table.data
-        
-        # New Data to update the Database
-        newData = DataFrame({"Date":[str(datetime.now().date())],"DebtToEquity":[self.de]})
-        
-        # Update Data
-        if list(data.loc[data['Date'] == str(datetime.now().date())].values) != []:
-            if not set(newData.keys()).issubset(data.loc[data['Date'] == str(datetime.now().date())].columns):
-                data = merge(data, newData, on='Date')
-            else:
-                data.loc[data['Date'] == str(datetime.now().date()),newData.columns] = newData.values
-            
-        else:
-            # Add New Data to the Database
-            data = concat([data, newData], axis=0, ignore_index= True)
-            
-        # Update the Database
-        table.update(data)
+        # Upsert Today's Row into the Fundementals Table
+        self._upsertDatabase([
+            Column("DebtToEquity",float)
+        ], [self.de])
         
     def _update(self) -> None:
         
@@ -698,4 +794,60 @@ class DebtToEquity(Fundemental):
  
  
  
- 
\ No newline at end of file
+ 
+
+# Fundemental Indicators with a Batch Percent Calculation
+FUNDEMENTALS = [PriceToEarnings, PriceToEarningsGrowth, EarningsPerShare, FreeCashflow, PriceToBook,
+                ReturnOnEquity, DividendPayout, PriceToSales, DividendYield, DebtToEquity]
+
+def calculatePercents(data:Union[DataFrame,dict]) -> DataFrame:
+    """Calculate the Percent of every Fundemental for a whole Universe at once
+
+    :param data: Inputs of the Fundementals by Name (forwardPE, trailingPE, peg, ...), one Row per Ticker
+    :type data: Union[DataFrame,dict]
+    :return: Percents with a Column per Fundemental that has all of its Inputs in the Data
+    :rtype: DataFrame
+    """
+    from pandas import DataFrame
+    
+    # Percents of each Fundemental
+    percents = {
+        fundemental.__name__: fundemental.calculatePercents(*[data[name] for name in fundemental.inputs])
+        for fundemental in FUNDEMENTALS if all(name in data for name in fundemental.inputs)
+    }
+    
+    return DataFrame(percents, index=data.index if isinstance(data, DataFrame) else None)
+
+def recordSnapshot(inputs:dict, database:Database = None, ticker:str = None, date:str = None) -> dict[str, float]:
+    """Calculate every Fundemental from One Record and Write the Inputs as a Single Row, instead of One Write per Fundemental
+
+    :param inputs: Inputs of the Fundementals by Name (forwardPE, trailingPE, peg, ...)
+    :type inputs: dict
+    :param database: Database to Write the Row to, Nothing is Written when None
+    :type database: Database
+    :param ticker: Ticker Symbol the Row Belongs to
+    :type ticker: str
+    :param date: Date of the Row, Today when None
+    :type date: str
+    :return: Percent of each Fundemental that has all of its Inputs in the Record, None where it can Not be Calculated
+    :rtype: dict[str, float]
+    """
+    percents, row = {}, {}
+    
+    for fundemental in FUNDEMENTALS:
+        if not all(name in inputs for name in fundemental.inputs): continue
+        
+        values = [inputs[name] for name in fundemental.inputs]
+        
+        # Percent, None where a Denominator is Zero as in the Batch Calculation
+        try:
+            percents[fundemental.__name__] = fundemental.calculatePercent(*values)
+        except ZeroDivisionError:
+            percents[fundemental.__name__] = None
+        
+        row.update(zip(fundemental.columns, values))
+    
+    if database is not None and row:
+        _upsertRow(database, ticker, date, row)
+    
+    return percents
@@ -0,0 +1,250 @@
+from collections import deque
+from math import fsum, isnan, nan, sqrt
+from pandas import DataFrame
+from database import Table
+from fundementals import FUNDEMENTALS, Fundemental
+
+# Statistics of each Window
+STATISTICS = ("Mean", "Std", "ZScore", "Min", "Max")
+
+
+
+
+
+class RollingWindow:
+    def __init__(self, window:int) -> None:
+        """Statistics of the Last Values, Updated a Value at a Time
+
+        :param window: Number of Values in the Window, Missing Values Count but are Left Out
+        :type window: int
+        :raises TypeError: Window Must be Positive
+        """
+        if window < 1: raise TypeError("Window Must be Positive")
+
+        # Number of Values in the Window
+        self.window = window
+
+        # Position of the Next Value
+        self._position = 0
+
+        # Values in the Window
+        self._values = deque()
+
+        # Candidates for the Minimum and Maximum, Monotonic so each is Found in Constant Time
+        self._minimums = deque()
+        self._maximums = deque()
+
+        # Last Value Added
+        self.last = nan
+
+    def add(self, value:float) -> None:
+        """Add the Next Value, Dropping the Value Leaving the Window
+
+        :param value: Value, None or NaN when Missing
+        :type value: float
+        """
+        position = self._position
+        self._position += 1
+
+        # Drop the Values Leaving the Window
+        while self._values and self._values[0][0] <= position - self.window:
+            self._values.popleft()
+
+        for candidates in (self._minimums, self._maximums):
+            while candidates and candidates[0][0] <= position - self.window:
+                candidates.popleft()
+
+        self.last = nan if value is None else value
+        if isnan(self.last): return
+
+        # Add the Value
+        self._values.append((position, value))
+
+        while self._minimums and self._minimums[-1][1] >= value:
+            self._minimums.pop()
+        self._minimums.append((position, value))
+
+        while self._maximums and self._maximums[-1][1] <= value:
+            self._maximums.pop()
+        self._maximums.append((position, value))
+
+    @property
+    def count(self) -> int:
+        return len(self._values)
+
+    @property
+    def mean(self) -> float:
+        """Mean of the Window, Summed from its Values so Running Sums can Not Drift
+
+        :return: Mean, NaN when the Window is Empty
+        :rtype: float
+        """
+        if not self.count: return nan
+
+        # A Flat Window's Mean is Exactly its Value
+        if self.min == self.max: return self.min
+
+        return fsum(value for _, value in self._values)/self.count
+
+    @property
+    def std(self) -> float:
+        """Sample Standard Deviation of the Window
+
+        :return: Standard Deviation, NaN with Fewer than Two Values
+        :rtype: float
+        """
+        if self.count < 2: return nan
+        if self.min == self.max: return 0.0
+
+        mean = self.mean
+
+        return sqrt(fsum((value - mean)**2 for _, value in self._values)/(self.count - 1))
+
+    @property
+    def zscore(self) -> float:
+        """Standard Deviations the Last Value is from the Mean of the Window
+
+        :return: Z-Score, NaN when the Last Value is Missing or the Window has No Spread
+        :rtype: float
+        """
+        std = self.std
+
+        return (self.last - self.mean)/std if std > 0 else nan
+
+    @property
+    def min(self) -> float:
+        return self._minimums[0][1] if self._minimums else nan
+
+    @property
+    def max(self) -> float:
+        return self._maximums[0][1] if self._maximums else nan
+
+    def statistics(self) -> tuple:
+        """Statistics of the Window
+
+        :return: Mean, Std, ZScore, Min and Max
+        :rtype: tuple
+        """
+        return self.mean, self.std, self.zscore, self.min, self.max
+
+def _fundementals(table:Table, fundementals:list[type[Fundemental]]) -> list[type[Fundemental]]:
+    """Fundementals with every Input Stored in the Table
+
+    :param table: Fundementals Table
+    :type table: Table
+    :param fundementals: Fundemental Classes
+    :type fundementals: list[type[Fundemental]]
+    :return: Fundemental Classes Stored in the Table
+    :rtype: list[type[Fundemental]]
+    """
+    columns = table.columns
+
+    return [fundemental for fundemental in fundementals if all(name in columns for name in fundemental.columns)]
+
+def percentHistory(table:Table, ticker:str = None, fundementals:list[type[Fundemental]] = None) -> DataFrame:
+    """Percent of each Fundemental on every Stored Date
+
+    :param table: Fundementals Table
+    :type table: Table
+    :param ticker: Ticker Symbol, every Row when None
+    :type ticker: str
+    :param fundementals: Fundemental Classes, all of them when None
+    :type fundementals: list[type[Fundemental]]
+    :return: Date, Ticker when Stored, and a Percent Column per Fundemental, by Date
+    :rtype: DataFrame
+    """
+    fundementals = _fundementals(table, fundementals or FUNDEMENTALS)
+
+    data = table.query(where={"Ticker":ticker} if ticker is not None else None).sort_values("Date", kind="stable")
+
+    return DataFrame({
+        **{name:data[name] for name in ("Ticker", "Date") if name in data},
+        **{fundemental.__name__:fundemental.calculatePercents(*[data[name] for name in fundemental.columns]) for fundemental in fundementals}
+    })
+
+class History:
+    def __init__(self, table:Table, window:int = 20, fundementals:list[type[Fundemental]] = None) -> None:
+        """Rolling Statistics of the Percent of each Fundemental, Updated with Only the Rows Stored since the Last Update
+
+        Rows are Taken in Once, by Date within each Update, and Rows Stored Late for an Earlier Date are still Seen.
+        Rows Updated in Place, e.g. Upserted again for the same Ticker and Date, are Not Taken in again.
+        The History can be Pickled to Keep its Windows between Runs.
+
+        :param table: Fundementals Table
+        :type table: Table
+        :param window: Number of Dates in each Window
+        :type window: int
+        :param fundementals: Fundemental Classes, all of them when None
+        :type fundementals: list[type[Fundemental]]
+        """
+
+        # Fundementals Table
+        self.table = table
+
+        # Number of Dates in each Window
+        self.window = window
+
+        # Fundemental Classes
+        self.fundementals = fundementals or FUNDEMENTALS
+
+        # Window of each Ticker and Fundemental
+        self._windows = {}
+
+        # Row Id of the Last Row Taken in
+        self.last = 0
+
+    def __getstate__(self) -> dict:
+
+        # Tables hold Connections, Reattach with the Table Attribute after Unpickling
+        return {**self.__dict__, "table":None}
+
+    def update(self) -> DataFrame:
+        """Take in the Rows Stored since the Last Update
+
+        :return: Ticker, Date, and for each Fundemental its Percent, Mean, Std, ZScore, Min and Max, of each New Row
+        :rtype: DataFrame
+        """
+        fundementals = _fundementals(self.table, self.fundementals)
+
+        # Rows Inserted after the Last Row Taken in
+        data = self.table.inserted(self.last).sort_values("Date", kind="stable")
+
+        tickers = data["Ticker"].tolist() if "Ticker" in data else [None]*len(data)
+        rows = {"Ticker":tickers, "Date":data["Date"].tolist()}
+
+        for fundemental in fundementals:
+            name = fundemental.__name__
+
+            # Percents of the New Rows
+            percents = fundemental.calculatePercents(*[data[column] for column in fundemental.columns]).tolist()
+
+            # Statistics after Adding each Percent to its Window
+            statistics = []
+            for ticker, percent in zip(tickers, percents):
+                window = self._windows.get((ticker, name))
+                if window is None:
+                    window = self._windows[(ticker, name)] = RollingWindow(self.window)
+
+                window.add(percent)
+                statistics.append(window.statistics())
+
+            rows[name] = percents
+            for statistic, values in zip(STATISTICS, zip(*statistics) if statistics else [[]]*len(STATISTICS)):
+                rows[f"{name}{statistic}"] = list(values)
+
+        if len(data):
+            self.last = int(data["RowId"].max())
+
+        return DataFrame(rows)
+
+    @property
+    def statistics(self) -> DataFrame:
+        """Current Statistics of each Ticker and Fundemental
+
+        :return: Ticker, Fundemental, Percent, Mean, Std, ZScore, Min and Max
+        :rtype: DataFrame
+        """
+        return DataFrame(
+            [(ticker, name, window.last, *window.statistics()) for (ticker, name), window in self._windows.items()],
+            columns=["Ticker", "Fundemental", "Percent", *STATISTICS]
+        )
@@ -1,6 +1,10 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod, abstractstaticmethod
-from typing import Union
-from pandas import DataFrame
+from typing import TYPE_CHECKING, Union
+
+# Pandas is Only Imported when a DataFrame is Asked for
+if TYPE_CHECKING:
+    from pandas import DataFrame
 
 class Indicator(ABC):
     def __init__(self, indicatorName:str, description:str, **kwargs) -> None:
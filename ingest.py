@@ -0,0 +1,162 @@
+from datetime import datetime
+from os import path
+from typing import Iterator
+from numpy import inf, nan
+from pandas import DataFrame, read_csv, read_json, to_datetime, to_numeric
+from database import Column, Database
+from fundementals import FUNDEMENTALS, calculatePercents, fundementalsTable
+
+# Fundementals Table Column of each Input
+COLUMNS = {name:column for fundemental in FUNDEMENTALS for name, column in zip(fundemental.inputs, fundemental.columns)}
+
+# File Formats by Extension
+FORMATS = {".csv":"csv", ".jsonl":"jsonl", ".ndjson":"jsonl", ".json":"jsonl"}
+
+
+
+
+
+def readChunks(fileDirectory:str, chunkSize:int = 100000, format:str = None) -> Iterator[DataFrame]:
+    """Read a CSV or JSON Lines File a Chunk of Rows at a Time
+
+    :param fileDirectory: File Directory
+    :type fileDirectory: str
+    :param chunkSize: Rows in each Chunk
+    :type chunkSize: int
+    :param format: "csv" or "jsonl", Taken from the Extension when None
+    :type format: str
+    :raises TypeError: Chunk Size Must be Positive
+    :raises TypeError: File Format Not Supported
+    :return: Chunks of the Rows
+    :rtype: Iterator[DataFrame]
+    """
+    if chunkSize < 1: raise TypeError("Chunk Size Must be Positive")
+
+    format = format or FORMATS.get(path.splitext(fileDirectory)[1].lower())
+    if format not in ("csv", "jsonl"): raise TypeError(f"{fileDirectory} File Format Not Supported")
+
+    # Tickers and Dates Read as Text, e.g. so Dates are not Parsed and Tickers like NAN are Kept
+    if format == "csv":
+        reader = read_csv(fileDirectory, chunksize=chunkSize, dtype={"Ticker":str, "Date":str}, keep_default_na=False, na_values=[""])
+    else:
+        reader = read_json(fileDirectory, lines=True, chunksize=chunkSize, dtype=False, convert_dates=False)
+
+    with reader:
+        yield from reader
+
+def validate(chunk:DataFrame, mapping:dict = None, date:str = None) -> tuple[DataFrame, int, int]:
+    """Rename a Chunk to the Inputs and Coerce its Values
+
+    :param chunk: Rows of the File
+    :type chunk: DataFrame
+    :param mapping: File Column Names and the Input Names they Hold, e.g. {"pe_fwd":"forwardPE", "symbol":"Ticker"}
+    :type mapping: dict
+    :param date: Date of Rows with No Date, Today when None
+    :type date: str
+    :raises TypeError: No Ticker Column
+    :return: Ticker, Date and the Inputs of the Valid Rows, Number of Rows Rejected and Number of Values Not a Number
+    :rtype: tuple[DataFrame, int, int]
+    """
+    chunk = chunk.rename(columns={"ticker":"Ticker", "date":"Date", **(mapping or {})})
+    if "Ticker" not in chunk: raise TypeError("No Ticker Column")
+
+    data = DataFrame(index=chunk.index)
+
+    # Tickers, Upper Case without Spaces
+    data["Ticker"] = chunk["Ticker"].astype("string").str.strip().str.upper()
+
+    # Dates as Year-Month-Day, the Given Date or Today for Rows with No Date
+    if "Date" in chunk:
+        data["Date"] = to_datetime(chunk["Date"], errors="coerce", format="mixed").dt.strftime("%Y-%m-%d")
+    else:
+        data["Date"] = date or str(datetime.now().date())
+
+    # Inputs as Floats, Text and Infinities as Missing
+    invalid = 0
+    for name in COLUMNS:
+        if name not in chunk: continue
+
+        values = to_numeric(chunk[name], errors="coerce").astype(float).replace([inf, -inf], nan)
+        invalid += int((values.isna() & chunk[name].notna()).sum())
+        data[name] = values
+
+    # Rows with No Ticker or Date
+    valid = data["Ticker"].notna() & (data["Ticker"] != "") & data["Date"].notna()
+
+    # Rows Repeated in the Chunk, the Last One Kept
+    data = data[valid].drop_duplicates(["Ticker", "Date"], keep="last")
+
+    return data, len(chunk) - int(valid.sum()), invalid
+
+def ingestChunks(database:Database, fileDirectory:str, mapping:dict = None, chunkSize:int = 100000, format:str = None, date:str = None) -> Iterator[DataFrame]:
+    """Write a Vendor Snapshot File into the Fundementals Table a Chunk at a Time, each Chunk in One Transaction
+
+    :param database: Database of the Fundementals Table
+    :type database: Database
+    :param fileDirectory: CSV or JSON Lines File Directory
+    :type fileDirectory: str
+    :param mapping: File Column Names and the Input Names they Hold
+    :type mapping: dict
+    :param chunkSize: Rows in each Chunk
+    :type chunkSize: int
+    :param format: "csv" or "jsonl", Taken from the Extension when None
+    :type format: str
+    :param date: Date of Rows with No Date, Today when None
+    :type date: str
+    :return: Ticker, Date and the Percent of each Fundemental with all its Inputs in the File, of each Chunk Written, with the Rows Rejected and Values Not a Number in its Attributes
+    :rtype: Iterator[DataFrame]
+    """
+    for chunk in readChunks(fileDirectory, chunkSize, format):
+        data, rejected, invalid = validate(chunk, mapping, date)
+
+        # Inputs in the File and their Columns in the Table
+        inputs = [name for name in COLUMNS if name in data]
+        columns = ["Ticker", "Date"] + [COLUMNS[name] for name in inputs]
+
+        # Fundementals Table Keyed by Ticker and Date with the Columns of the File
+        table = fundementalsTable(database, [Column(column, float) for column in columns[2:]])
+
+        # Rows as Tuples with Missing Values as None
+        values = data[["Ticker", "Date"] + inputs].astype(object).where(data[["Ticker", "Date"] + inputs].notna(), None)
+
+        with database.transaction():
+            table.upsertValues(columns, list(values.itertuples(index=False, name=None)), ["Ticker","Date"])
+
+        # Percents of the Chunk
+        percents = calculatePercents(data)
+        percents.insert(0, "Ticker", data["Ticker"])
+        percents.insert(1, "Date", data["Date"])
+        percents.attrs.update(rejected=rejected, invalid=invalid)
+
+        yield percents
+
+def ingest(database:Database, fileDirectory:str, mapping:dict = None, chunkSize:int = 100000, format:str = None, date:str = None) -> dict:
+    """Write a Vendor Snapshot File into the Fundementals Table, Holding One Chunk in Memory at a Time
+
+    :param database: Database of the Fundementals Table
+    :type database: Database
+    :param fileDirectory: CSV or JSON Lines File Directory
+    :type fileDirectory: str
+    :param mapping: File Column Names and the Input Names they Hold
+    :type mapping: dict
+    :param chunkSize: Rows in each Chunk
+    :type chunkSize: int
+    :param format: "csv" or "jsonl", Taken from the Extension when None
+    :type format: str
+    :param date: Date of Rows with No Date, Today when None
+    :type date: str
+    :return: Number of Chunks, Rows Written, Rows Rejected, Values Not a Number and Percents Calculated of each Fundemental
+    :rtype: dict
+    """
+    result = {"chunks":0, "rows":0, "rejected":0, "invalid":0, "percents":{}}
+
+    for percents in ingestChunks(database, fileDirectory, mapping, chunkSize, format, date):
+        result["chunks"] += 1
+        result["rows"] += len(percents)
+        result["rejected"] += percents.attrs["rejected"]
+        result["invalid"] += percents.attrs["invalid"]
+
+        for name in percents.columns[2:]:
+            result["percents"][name] = result["percents"].get(name, 0) + int(percents[name].notna().sum())
+
+    return result
@@ -0,0 +1,180 @@
+import logging
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Iterator
+
+# Upper Bounds in Seconds of the Latency Histogram Buckets
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+
+
+
+class Span:
+    def __init__(self, operation:str, table:str = None) -> None:
+        """Single Timed Operation on the Database
+
+        :param operation: Operation Name
+        :type operation: str
+        :param table: Table Name the Operation is on
+        :type table: str
+        """
+
+        # Operation and Table Names
+        self.operation = operation
+        self.table = table
+
+        # Rows and Bytes Read or Written, Set by the Operation
+        self.rows = 0
+        self.bytes = 0
+
+        # Error the Operation Raised
+        self.error = None
+
+        # Start and Duration in Seconds
+        self.start = perf_counter()
+        self.duration = None
+
+class Metrics:
+    def __init__(self, enabled:bool = True, buckets:tuple = BUCKETS) -> None:
+        """Counts, Rows, Bytes and Latency Histograms of each Operation and Table, with Hooks Called on each Finished Span
+
+        :param enabled: If Spans are Recorded
+        :type enabled: bool
+        :param buckets: Upper Bounds in Seconds of the Latency Histogram Buckets
+        :type buckets: tuple
+        """
+
+        # If Spans are Recorded
+        self.enabled = enabled
+
+        # Upper Bounds of the Latency Histogram Buckets
+        self.buckets = tuple(buckets)
+
+        # Statistics of each Operation and Table
+        self._statistics = {}
+        self._lock = threading.Lock()
+
+        # Functions Called with each Finished Span
+        self._hooks = []
+
+    @contextmanager
+    def span(self, operation:str, table:str = None) -> Iterator[Span]:
+        """Time an Operation and Record it when it Finishes
+
+        :param operation: Operation Name
+        :type operation: str
+        :param table: Table Name the Operation is on
+        :type table: str
+        :return: Span for the Operation to Set its Rows and Bytes on
+        :rtype: Iterator[Span]
+        """
+        span = Span(operation, table)
+
+        if not self.enabled:
+            yield span
+            return
+
+        try:
+            yield span
+        except BaseException as error:
+            span.error = error
+            raise
+        finally:
+            span.duration = perf_counter() - span.start
+            self.record(span)
+
+    def record(self, span:Span) -> None:
+        """Add a Finished Span to the Statistics and Call the Hooks, a Hook Raising is Logged so the Operation still Succeeds
+
+        :param span: Finished Span
+        :type span: Span
+        """
+        with self._lock:
+            statistics = self._statistics.get((span.operation, span.table))
+            if statistics is None:
+                statistics = self._statistics[(span.operation, span.table)] = {"count":0, "errors":0, "rows":0, "bytes":0, "seconds":0.0, "buckets":[0]*(len(self.buckets) + 1)}
+
+            statistics["count"] += 1
+            statistics["errors"] += span.error is not None
+            statistics["rows"] += span.rows
+            statistics["bytes"] += span.bytes
+            statistics["seconds"] += span.duration
+            statistics["buckets"][bisect_left(self.buckets, span.duration)] += 1
+
+        for hook in list(self._hooks):
+            try:
+                hook(span)
+            except Exception:
+                logging.getLogger(__name__).exception(f"Metrics Hook {hook} Failed on {span.operation}")
+
+    def addHook(self, hook:Callable[[Span], None]) -> None:
+        """Call a Function with each Finished Span, e.g. to Export Tracing Spans
+
+        :param hook: Function Called with the Span
+        :type hook: Callable[[Span], None]
+        """
+        self._hooks.append(hook)
+
+    def removeHook(self, hook:Callable[[Span], None]) -> None:
+        self._hooks.remove(hook)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._statistics = {}
+
+    def toDict(self) -> dict:
+        """Statistics of each Operation and Table
+
+        :return: "operation" or "operation:table" and their Count, Errors, Rows, Bytes, Seconds and Cumulative Latency Buckets
+        :rtype: dict
+        """
+        with self._lock:
+            statistics = {key:{**value, "buckets":list(value["buckets"])} for key, value in self._statistics.items()}
+
+        result = {}
+        for (operation, table), value in statistics.items():
+            counts, total = {}, 0
+            for bound, count in zip([*self.buckets, "+Inf"], value["buckets"]):
+                total += count
+                counts[bound] = total
+
+            result[operation if table is None else f"{operation}:{table}"] = {**value, "buckets":counts}
+
+        return result
+
+    def toPrometheus(self, prefix:str = "fundementals_database") -> str:
+        """Statistics in the Prometheus Text Exposition Format
+
+        :param prefix: Prefix of the Metric Names
+        :type prefix: str
+        :return: Prometheus Text
+        :rtype: str
+        """
+        with self._lock:
+            statistics = {key:{**value, "buckets":list(value["buckets"])} for key, value in self._statistics.items()}
+
+        lines = []
+
+        for name, kind, help in (("operations_total", "counter", "Operations Run"), ("errors_total", "counter", "Operations that Raised"),
+                                 ("rows_total", "counter", "Rows Read or Written"), ("bytes_total", "counter", "Bytes Read or Written")):
+            lines += [f"# HELP {prefix}_{name} {help}", f"# TYPE {prefix}_{name} {kind}"]
+            field = "count" if name == "operations_total" else name[:-6]
+            for (operation, table), value in statistics.items():
+                lines.append(f'{prefix}_{name}{{operation="{operation}",table="{table or ""}"}} {value[field]}')
+
+        lines += [f"# HELP {prefix}_latency_seconds Latency of the Operations", f"# TYPE {prefix}_latency_seconds histogram"]
+        for (operation, table), value in statistics.items():
+            labels = f'operation="{operation}",table="{table or ""}"'
+
+            total = 0
+            for bound, count in zip([*self.buckets, "+Inf"], value["buckets"]):
+                total += count
+                lines.append(f'{prefix}_latency_seconds_bucket{{{labels},le="{bound}"}} {total}')
+
+            lines.append(f"{prefix}_latency_seconds_sum{{{labels}}} {value['seconds']}")
+            lines.append(f"{prefix}_latency_seconds_count{{{labels}}} {value['count']}")
+
+        return "\n".join(lines) + "\n"
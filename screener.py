@@ -0,0 +1,140 @@
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from typing import Union
+from numpy import argpartition, argsort, asarray, flatnonzero, isnan, nan, ndarray, where, zeros
+from pandas import DataFrame, Series, concat
+from fundementals import FUNDEMENTALS, Fundemental, calculatePercents
+
+
+
+
+
+def _screenShard(shard:DataFrame) -> DataFrame:
+    """Percents of every Fundemental for a Shard of the Universe
+
+    :param shard: Inputs of the Fundementals, one Row per Ticker
+    :type shard: DataFrame
+    :return: Percents with a Column per Fundemental
+    :rtype: DataFrame
+    """
+    return calculatePercents(shard)
+
+def screen(data:Union[DataFrame,list[dict]], workers:int = None, chunkSize:int = 100000) -> DataFrame:
+    """Calculate the Percent of every Fundemental across a Universe, Sharded over Processes
+
+    :param data: Inputs of the Fundementals by Name (forwardPE, trailingPE, peg, ...), one Row per Ticker
+    :type data: Union[DataFrame,list[dict]]
+    :param workers: Number of Processes, the Number of CPUs when None
+    :type workers: int
+    :param chunkSize: Rows in each Shard
+    :type chunkSize: int
+    :raises TypeError: Chunk Size Must be Positive
+    :return: The Data with a Percent Column per Fundemental, in the Order of the Data
+    :rtype: DataFrame
+    """
+    if chunkSize < 1: raise TypeError("Chunk Size Must be Positive")
+
+    if not isinstance(data, DataFrame):
+        data = DataFrame(data)
+
+    # Shards of the Universe
+    shards = [data.iloc[start:start + chunkSize] for start in range(0, len(data), chunkSize)] or [data]
+
+    # Number of Processes
+    workers = min(workers or cpu_count() or 1, len(shards))
+
+    # Calculating the Percents, in this Process when there is Nothing to Share
+    if workers == 1:
+        percents = [_screenShard(shard) for shard in shards]
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            percents = list(executor.map(_screenShard, shards))
+
+    return concat([data, concat(percents)], axis=1)
+
+def _percents(data:DataFrame, fundemental:Union[type[Fundemental],str]) -> Series:
+    """Percents of a Fundemental, Taken from the Data when Screened Already
+
+    :param data: Inputs or Percents of the Fundementals, one Row per Ticker
+    :type data: DataFrame
+    :param fundemental: Fundemental Class or its Name
+    :type fundemental: Union[type[Fundemental],str]
+    :raises TypeError: Fundemental Does Not Exist
+    :raises TypeError: Fundemental is Missing Inputs
+    :return: Percents
+    :rtype: Series
+    """
+    name = fundemental if isinstance(fundemental, str) else fundemental.__name__
+
+    if name in data:
+        return data[name]
+
+    # Fundemental of the Name
+    fundemental = {fundemental.__name__:fundemental for fundemental in FUNDEMENTALS}.get(name)
+    if fundemental is None: raise TypeError(f"{name} Fundemental Does Not Exist")
+
+    for input in fundemental.inputs:
+        if input not in data: raise TypeError(f"{name} is Missing the {input} Input")
+
+    return Series(fundemental.calculatePercents(*[data[input] for input in fundemental.inputs]), index=data.index)
+
+def score(data:DataFrame, weights:dict, groupBy:str = None) -> ndarray:
+    """Composite Score of each Row, the Weighted Mean of the Percentile Rank of each Fundemental's Percent
+
+    Ranks are taken within each Group when Grouped (e.g. by Sector). Higher Percents Rank
+    Higher, a Negative Weight Favours Lower Percents. Missing Percents are left out of the
+    Mean, a Row with None is NaN.
+
+    :param data: Inputs or Percents of the Fundementals, one Row per Ticker
+    :type data: DataFrame
+    :param weights: Fundemental Classes or Names and their Weights
+    :type weights: dict
+    :param groupBy: Column Name to Rank within
+    :type groupBy: str
+    :return: Scores between 0 and 1
+    :rtype: ndarray
+    """
+    total, weight = zeros(len(data)), zeros(len(data))
+
+    for fundemental, w in weights.items():
+        percents = _percents(data, fundemental)
+
+        # Percentile Rank in the Universe or the Group, Lowest Percent Ranked Highest for Negative Weights
+        ranks = (percents.groupby(data[groupBy]) if groupBy else percents).rank(pct=True, ascending=w >= 0)
+        ranks = asarray(ranks, dtype=float)
+
+        # Adding the Ranks that are Not Missing
+        present = ~isnan(ranks)
+        total[present] += abs(w)*ranks[present]
+        weight[present] += abs(w)
+
+    return where(weight > 0, total/where(weight > 0, weight, 1), nan)
+
+def topK(data:DataFrame, weights:dict, k:int = 10, groupBy:str = None) -> DataFrame:
+    """Rows with the Highest Composite Score, Selected with a Partial Partition instead of a Full Sort
+
+    :param data: Inputs or Percents of the Fundementals, one Row per Ticker
+    :type data: DataFrame
+    :param weights: Fundemental Classes or Names and their Weights
+    :type weights: dict
+    :param k: Number of Rows
+    :type k: int
+    :param groupBy: Column Name to Rank within
+    :type groupBy: str
+    :raises TypeError: K Must be Positive
+    :return: The k Rows with a Score Column, Highest Score First
+    :rtype: DataFrame
+    """
+    if k < 1: raise TypeError("K Must be Positive")
+
+    scores = score(data, weights, groupBy)
+
+    # Rows with a Score
+    positions = flatnonzero(~isnan(scores))
+
+    # The k Highest in Linear Time, then Ordered
+    if k < len(positions):
+        positions = positions[argpartition(-scores[positions], k - 1)[:k]]
+    positions = positions[argsort(-scores[positions], kind="stable")]
+
+    return data.iloc[positions].assign(Score=scores[positions])
@@ -0,0 +1,376 @@
+import argparse
+import json
+import threading
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from math import isfinite, isnan
+from queue import Empty, Queue
+from statistics import quantiles
+from time import perf_counter
+from database import Column, Database
+from fundementals import FUNDEMENTALS, fundementalsTable
+
+# Latencies Kept for the Percentiles
+LATENCIES = 10000
+
+
+
+
+
+class RequestError(ValueError):
+    """Request that can Not be Scored as Sent, the Client's Error
+    """
+
+class Batcher:
+    def __init__(self, database:Database = None, window:float = 0.002, batchSize:int = 4096) -> None:
+        """Group Requests Arriving within a Window into One Batch, Calculated with each Fundemental's Batch Percent Calculation
+
+        :param database: Database to Write the Inputs of Requests with a Ticker to, Nothing is Written when None
+        :type database: Database
+        :param window: Seconds a Batch Waits for more Requests after its First
+        :type window: float
+        :param batchSize: Most Requests in One Batch
+        :type batchSize: int
+        """
+
+        # Database the Inputs are Written to
+        self.database = database
+
+        # Seconds a Batch Waits and Most Requests in One Batch
+        self.window = window
+        self.batchSize = batchSize
+
+        # Fundemental Classes by Name
+        self.fundementals = {fundemental.__name__:fundemental for fundemental in FUNDEMENTALS}
+
+        # Requests Waiting, Futures of their Results and their Arrival Times
+        self._queue = Queue()
+
+        # Counts and Recent Latencies in Milliseconds
+        self._lock = threading.Lock()
+        self._start = perf_counter()
+        self._requests = 0
+        self._errors = 0
+        self._batches = 0
+        self._latencies = deque(maxlen=LATENCIES)
+
+        # Thread Calculating the Batches
+        self._thread = threading.Thread(target=self._run, name="Batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, request:dict) -> Future:
+        """Queue a Request for the Next Batch
+
+        :param request: "fundemental" Name, its "inputs" by Name and an optional "ticker"
+        :type request: dict
+        :return: Future of the Fundemental, Ticker and Percent, None when the Percent can Not be Calculated
+        :rtype: Future
+        """
+        future = Future()
+        self._queue.put((request, future, perf_counter()))
+
+        return future
+
+    def score(self, requests:list[dict], timeout:float = 30.0, errors:bool = False) -> list[dict]:
+        """Calculate Requests in the Batches, Waiting for their Results
+
+        :param requests: Requests, see Submit
+        :type requests: list[dict]
+        :param timeout: Seconds to Wait for all the Results
+        :type timeout: float
+        :param errors: Return the Error of a Failed Request as {"error":...} in Place of its Result instead of Raising it
+        :type errors: bool
+        :raises TimeoutError: Results Not Ready in Time
+        :raises RequestError: Request can Not be Scored as Sent
+        :return: Results in the Order of the Requests
+        :rtype: list[dict]
+        """
+        futures = [self.submit(request) for request in requests]
+        deadline = perf_counter() + timeout
+        results = []
+
+        for future in futures:
+            try:
+                results.append(future.result(timeout=max(deadline - perf_counter(), 0)))
+            except TimeoutError:
+                raise
+            except Exception as error:
+                if not errors: raise
+                results.append({"error":str(error)})
+
+        return results
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+
+        while True:
+            # Wait for a Request then take the others Arriving within the Window
+            item = self._queue.get()
+            if item is None: return
+
+            batch = [item]
+            deadline = perf_counter() + self.window
+
+            while len(batch) < self.batchSize:
+                try:
+                    item = self._queue.get(timeout=max(deadline - perf_counter(), 0))
+                except Empty:
+                    break
+
+                # Finish the Batch before Stopping
+                if item is None:
+                    self._evaluate(batch)
+                    return
+
+                batch.append(item)
+
+            self._evaluate(batch)
+
+    def _evaluate(self, batch:list[tuple]) -> None:
+        """Calculate a Batch, Failing the Requests Left Pending on any Error so the Batcher Keeps Running
+
+        :param batch: Requests, their Futures and Arrival Times
+        :type batch: list[tuple]
+        """
+        failed = []
+
+        try:
+            self._calculate(batch, failed)
+        except Exception as error:
+            for _, future, start in batch:
+                if not future.done():
+                    future.set_exception(error)
+                    failed.append(start)
+        finally:
+
+            # Counts and Latencies
+            end = perf_counter()
+            with self._lock:
+                self._batches += 1
+                self._requests += len(batch)
+                self._errors += len(failed)
+                self._latencies.extend((end - start)*1000 for _, _, start in batch)
+
+    def _check(self, request:dict) -> Exception:
+        """Find what is Wrong with a Request, so One Bad Request does Not Fail its Batch
+
+        :param request: Request, see Submit
+        :type request: dict
+        :return: Error of the Request, None when it is Valid
+        :rtype: Exception
+        """
+        if not isinstance(request, dict): return RequestError(f"{request} is Not a Request")
+
+        fundemental = self.fundementals.get(request.get("fundemental")) if isinstance(request.get("fundemental"), str) else None
+        if fundemental is None: return RequestError(f"{request.get('fundemental')} Fundemental Does Not Exist")
+
+        if not isinstance(request.get("ticker"), (str, type(None))): return RequestError("Ticker Must be Text or None")
+
+        inputs = request.get("inputs", {})
+        if not isinstance(inputs, dict): return RequestError("Inputs Must be a Dictionary")
+
+        for name in fundemental.inputs:
+            value = inputs.get(name)
+            if value is None: continue
+
+            # Finite Numbers that Fit in a Float
+            if isinstance(value, bool) or not isinstance(value, (int, float)): return RequestError(f"Inputs of {fundemental.__name__} Must be Numbers or None")
+            try:
+                if not isfinite(float(value)): raise OverflowError
+            except OverflowError:
+                return RequestError(f"Inputs of {fundemental.__name__} Must be Finite")
+
+        return None
+
+    def _calculate(self, batch:list[tuple], failed:list[float]) -> None:
+        """Calculate the Percents of a Batch, One Calculation per Fundemental, and Write the Inputs in One Transaction
+
+        :param batch: Requests, their Futures and Arrival Times
+        :type batch: list[tuple]
+        :param failed: Arrival Times of the Failed Requests, Added to
+        :type failed: list[float]
+        """
+
+        # Requests of each Fundemental
+        groups = {}
+        for request, future, start in batch:
+            error = self._check(request)
+
+            if error is None:
+                groups.setdefault(self.fundementals[request["fundemental"]], []).append((request, future, start))
+            else:
+                future.set_exception(error)
+                failed.append(start)
+
+        # Today's Row of each Ticker and the Results, with if their Inputs are Written
+        rows, results = {}, []
+        date = str(datetime.now().date())
+
+        for fundemental, requests in groups.items():
+            try:
+                inputs = [[request.get("inputs", {}).get(name) for request, _, _ in requests] for name in fundemental.inputs]
+                percents = fundemental.calculatePercents(*inputs).tolist()
+            except Exception as error:
+                for _, future, start in requests:
+                    future.set_exception(error)
+                    failed.append(start)
+                continue
+
+            for (request, future, start), percent, *values in zip(requests, percents, *inputs):
+                ticker = request.get("ticker")
+                results.append((future, start, {"fundemental":fundemental.__name__, "ticker":ticker, "percent":None if isnan(percent) else percent}, ticker is not None))
+
+                if ticker is not None:
+                    rows.setdefault(ticker, {"Ticker":ticker, "Date":date}).update(zip(fundemental.columns, values))
+
+        # Write the Inputs of the Batch, a Failed Write Only Fails the Requests Written
+        if self.database is not None and rows:
+            try:
+                columns = list(dict.fromkeys(name for row in rows.values() for name in row if name not in ("Ticker", "Date")))
+                with self.database.transaction():
+                    fundementalsTable(self.database, [Column(name, float) for name in columns]).upsertMany(list(rows.values()), ["Ticker","Date"])
+            except Exception as error:
+                for future, start, _, written in results:
+                    if written:
+                        future.set_exception(error)
+                        failed.append(start)
+                results = [result for result in results if not result[3]]
+
+        for future, _, result, _ in results:
+            future.set_result(result)
+
+    @property
+    def stats(self) -> dict:
+        """Throughput and Latency of the Requests
+
+        :return: Requests, Errors, Batches, Mean Batch Size, Requests per Second since the Start and Latency Percentiles in Milliseconds of the Recent Requests
+        :rtype: dict
+        """
+        with self._lock:
+            latencies = list(self._latencies)
+            requests, errors, batches = self._requests, self._errors, self._batches
+
+        percentiles = quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else (latencies or [None])*99
+
+        return {
+            "requests":requests, "errors":errors, "batches":batches,
+            "batchSize":requests/batches if batches else 0,
+            "throughput":requests/(perf_counter() - self._start),
+            "p50":percentiles[49], "p90":percentiles[89], "p99":percentiles[98]
+        }
+
+class ScoringServer(ThreadingHTTPServer):
+    def __init__(self, databaseDirectory:str = None, host:str = "127.0.0.1", port:int = 8765, window:float = 0.002, batchSize:int = 4096) -> None:
+        """Local HTTP Server Scoring Fundementals in Micro-Batches on One Warm Database
+
+        POST /score takes a Request or a List of Requests, see Batcher.submit, and returns their Results,
+        with {"error":...} in Place of the Result of each Failed Request in a List.
+        GET /stats returns the Throughput and Latency of the Requests and the Metrics of the Database.
+
+        :param databaseDirectory: Directory of the Database the Inputs are Written to, Nothing is Written when None
+        :type databaseDirectory: str
+        :param host: Host to Listen on
+        :type host: str
+        :param port: Port to Listen on, any Free Port when 0
+        :type port: int
+        :param window: Seconds a Batch Waits for more Requests after its First
+        :type window: float
+        :param batchSize: Most Requests in One Batch
+        :type batchSize: int
+        """
+        super().__init__((host, port), _Handler)
+
+        # Database Held Open for every Request
+        self.database = Database(databaseDirectory) if databaseDirectory else None
+
+        # Batches of the Requests
+        self.batcher = Batcher(self.database, window, batchSize)
+
+        # Thread Serving in the Background
+        self._thread = None
+
+    def start(self) -> None:
+        """Serve on a Background Thread
+        """
+        self._thread = threading.Thread(target=self.serve_forever, name="ScoringServer", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop Serving, then Finish the Batches and Close the Database
+        """
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+
+        self.server_close()
+        self.batcher.close()
+        if self.database is not None: self.database.close()
+
+class _Handler(BaseHTTPRequestHandler):
+
+    # Keep Connections Open between Requests, Sending each Response at once instead of Waiting to Fill a Packet
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _send(self, status:int, body:object) -> None:
+        data = json.dumps(body).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        if self.path != "/stats": return self._send(404, {"error":f"{self.path} Does Not Exist"})
+
+        self._send(200, {**self.server.batcher.stats, "database":self.server.database.metrics.toDict() if self.server.database else {}})
+
+    def do_POST(self) -> None:
+        if self.path != "/score": return self._send(404, {"error":f"{self.path} Does Not Exist"})
+
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        except ValueError as error:
+            return self._send(400, {"error":str(error)})
+
+        # Requests Invalid as Sent are the Client's Error, any Other Error is the Server's
+        try:
+            results = self.server.batcher.score(body if isinstance(body, list) else [body], errors=isinstance(body, list))
+        except RequestError as error:
+            return self._send(400, {"error":str(error)})
+        except TimeoutError:
+            return self._send(504, {"error":"Scoring Timed Out"})
+        except Exception as error:
+            return self._send(500, {"error":str(error)})
+
+        self._send(200, results if isinstance(body, list) else results[0])
+
+    def log_message(self, format:str, *args) -> None:
+        pass
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve Fundemental Percents over Local HTTP in Micro-Batches")
+    parser.add_argument("--database", default=None, help="Database the Inputs of Requests with a Ticker are Written to")
+    parser.add_argument("--host", default="127.0.0.1", help="Host to Listen on")
+    parser.add_argument("--port", type=int, default=8765, help="Port to Listen on")
+    parser.add_argument("--window", type=float, default=0.002, help="Seconds a Batch Waits for more Requests")
+    parser.add_argument("--batch-size", type=int, default=4096, help="Most Requests in One Batch")
+    arguments = parser.parse_args()
+
+    server = ScoringServer(arguments.database, arguments.host, arguments.port, arguments.window, arguments.batch_size)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+from datetime import datetime
+from math import isnan
+import pytest
+from columnar import ColumnarDatabase
+from database import Column, Database
+from fundementals import PriceToBook, PriceToEarnings
+
+
+
+
+
+@pytest.fixture(params=["sqlite", "columnar"])
+def database(request, tmp_path):
+    database = Database(str(tmp_path / "test.db")) if request.param == "sqlite" else ColumnarDatabase(str(tmp_path / "test.cols"))
+    yield database
+    database.close()
+
+@pytest.fixture
+def table(database):
+    database.addTable("Prices", [Column("Ticker",str), Column("Date",str), Column("Close",float)], unique=["Ticker","Date"])
+    return database.getTable("Prices")
+
+def rows(df) -> list[tuple]:
+    return sorted(df.itertuples(index=False, name=None))
+
+def test_fundemental(database):
+    PriceToEarnings(20.0, 25.0, database=database, ticker="AAA")
+    PriceToBook(2.0, database=database, ticker="AAA")
+
+    table = database.getTable("Fundementals")
+    data = table.tickerData("AAA")
+
+    assert len(data) == 1
+    assert data["Date"].iloc[0] == str(datetime.now().date())
+    assert data["ForwardPE"].iloc[0] == 20.0
+    assert data["TrailingPE"].iloc[0] == 25.0
+    assert data["PriceToBook"].iloc[0] == 2.0
+    assert table.tickers == ["AAA"]
+
+def test_upsert(table):
+    table.upsert({"Ticker":"AAA", "Date":"2024-01-01", "Close":1.0}, ["Ticker","Date"])
+    table.upsertMany([
+        {"Ticker":"AAA", "Date":"2024-01-01", "Close":2.0},
+        {"Ticker":"BBB", "Date":"2024-01-01", "Close":3.0},
+        {"Ticker":"BBB", "Date":"2024-01-02"},
+    ], ["Ticker","Date"])
+
+    data = rows(table.query(["Ticker","Date","Close"]))
+
+    assert data[:2] == [("AAA","2024-01-01",2.0), ("BBB","2024-01-01",3.0)]
+    assert data[2][:2] == ("BBB","2024-01-02") and isnan(data[2][2])
+
+def test_query(table):
+    table.upsertMany([{"Ticker":ticker, "Date":f"2024-01-0{day}", "Close":float(day)} for ticker in ["AAA","BBB"] for day in range(1, 6)], ["Ticker","Date"])
+
+    assert rows(table.query(["Date","Close"], where={"Ticker":"BBB"}, start="2024-01-02", end="2024-01-03")) == [("2024-01-02",2.0), ("2024-01-03",3.0)]
+    assert len(table.query(where={"Ticker":"CCC"})) == 0
+    assert len(table.query(limit=3)) == 3
+
+def test_query_snapshot(table):
+    table.upsert({"Ticker":"AAA", "Date":"2024-01-01", "Close":1.0}, ["Ticker","Date"])
+    data, queried = table.data, table.query(["Close"], where={"Ticker":"AAA"})
+    chunk = next(table.stream())
+
+    table.upsert({"Ticker":"AAA", "Date":"2024-01-01", "Close":99.0}, ["Ticker","Date"])
+
+    assert list(data["Close"]) == list(queried["Close"]) == list(chunk["Close"]) == [1.0]
+    assert list(table.data["Close"]) == [99.0]
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_dates(database, table, indexed):
+    if indexed: table.addIndex(["Date"])
+
+    def closes(start=None, end=None, where=None) -> list[float]:
+        return sorted(table.query(["Close"], where=where, start=start, end=end)["Close"])
+
+    # Later Dates Appended, then an Earlier Date and a Missing Date Out of Order
+    table.upsertMany([{"Ticker":"AAA", "Date":f"2024-01-{day:02}", "Close":float(day)} for day in range(1, 11)], ["Ticker","Date"])
+    assert closes("2024-01-03", "2024-01-05") == [3.0, 4.0, 5.0]
+
+    table.upsertMany([{"Ticker":"BBB", "Date":"2024-01-04", "Close":40.0}, {"Ticker":"CCC", "Date":None, "Close":0.0}], ["Ticker","Date"])
+    assert closes("2024-01-03", "2024-01-05") == [3.0, 4.0, 5.0, 40.0]
+    assert closes(end="2024-01-02") == [1.0, 2.0]
+    assert closes(start="2024-01-09") == [9.0, 10.0]
+    assert closes("2024-01-04", "2024-01-04", {"Ticker":"BBB"}) == [40.0]
+    assert closes("2024-02-01") == []
+
+    # Dates Kept after Rolling Back and Reopening
+    with pytest.raises(ValueError):
+        with database.transaction():
+            table.upsert({"Ticker":"AAA", "Date":"2024-01-00", "Close":-1.0}, ["Ticker","Date"])
+            raise ValueError
+
+    database.close()
+    reopened = type(database)(database.databaseDirectory)
+    table = reopened.getTable("Prices")
+    table.upsert({"Ticker":"DDD", "Date":"2024-01-11", "Close":11.0}, ["Ticker","Date"])
+
+    assert closes("2024-01-04", "2024-01-11") == [4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 40.0]
+    reopened.close()
+
+def test_missing_ticker(table):
+    table.upsertMany([
+        {"Ticker":None, "Date":"2024-01-01", "Close":1.0},
+        {"Ticker":"AAA", "Date":"2024-01-01", "Close":2.0},
+        {"Ticker":None, "Date":"2024-01-01", "Close":3.0},
+    ], ["Ticker","Date"])
+
+    assert rows(table.query(["Ticker","Close"], where={"Ticker":None})) == [(None,3.0)]
+    assert rows(table.tickerData(None)[["Ticker","Close"]]) == [(None,3.0)]
+    assert [row for chunk in table.stream(columns=["Ticker","Close"], where={"Ticker":None}, records=True) for row in chunk] == [(None,3.0)]
+    assert table.tickers == ["AAA"]
+
+def test_missing_integer(database):
+    database.addTable("Counts", [Column("Date",str), Column("N",int)], unique=["Date"])
+    table = database.getTable("Counts")
+
+    table.upsert({"Date":"2024-01-01", "N":None})
+    assert list(table.query(["N"])["N"]) == [None]
+
+    table.upsertMany([{"Date":"2024-01-02", "N":0}, {"Date":"2024-01-03", "N":5}])
+    values = list(table.query(["N"])["N"])
+    assert isnan(values[0]) and values[1:] == [0, 5]
+
+    assert list(table.query(["Date"], where={"N":None})["Date"]) == ["2024-01-01"]
+    assert list(table.query(["Date"], where={"N":0})["Date"]) == ["2024-01-02"]
+
+    table.upsert({"Date":"2024-01-01", "N":7})
+    assert list(table.query(["N"])["N"]) == [7, 0, 5]
+
+def test_stream(table):
+    table.upsertMany([{"Ticker":"AAA", "Date":f"2024-01-{day:02}", "Close":float(day)} for day in range(1, 26)], ["Ticker","Date"])
+
+    chunks = list(table.stream(10, ["Date","Close"], records=True))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert sorted(row for chunk in chunks for row in chunk) == [(f"2024-01-{day:02}", float(day)) for day in range(1, 26)]
+
+def test_transaction_commits(database, table):
+    with database.transaction():
+        table.upsert({"Ticker":"AAA", "Date":"2024-01-01", "Close":1.0}, ["Ticker","Date"])
+        with database.transaction():
+            table.upsert({"Ticker":"BBB", "Date":"2024-01-01", "Close":2.0}, ["Ticker","Date"])
+
+    assert rows(table.query(["Ticker","Close"])) == [("AAA",1.0), ("BBB",2.0)]
+
+def test_transaction_rolls_back(database, table):
+    table.upsert({"Ticker":"AAA", "Date":"2024-01-01", "Close":1.0}, ["Ticker","Date"])
+
+    with pytest.raises(ValueError):
+        with database.transaction():
+            table.upsert({"Ticker":"AAA", "Date":"2024-01-01", "Close":9.0}, ["Ticker","Date"])
+            table.upsert({"Ticker":"ROLL", "Date":"2024-01-01", "Close":9.0}, ["Ticker","Date"])
+            table.addColumn(Column("Volume",float))
+            database.addTable("Other", [Column("Date",str)])
+            raise ValueError
+
+    assert rows(table.query(["Ticker","Close"])) == [("AAA",1.0)]
+    assert "Volume" not in table.columns
+    assert not database.hasTable("Other")
+
+    # Writes after the Roll Back Land in the Right Rows
+    table.upsert({"Ticker":"ROLL", "Date":"2024-01-01", "Close":3.0}, ["Ticker","Date"])
+    assert rows(table.query(["Ticker","Close"])) == [("AAA",1.0), ("ROLL",3.0)]
+
+def test_long_text(database, table):
+    ticker = "X"*100
+    table.upsert({"Ticker":ticker, "Date":"2024-01-01", "Close":1.0}, ["Ticker","Date"])
+    table.upsert({"Ticker":ticker + "Y", "Date":"2024-01-01", "Close":2.0}, ["Ticker","Date"])
+    table.upsert({"Ticker":ticker, "Date":"2024-01-01", "Close":3.0}, ["Ticker","Date"])
+
+    assert rows(table.query(["Ticker","Close"], where={"Ticker":ticker})) == [(ticker,3.0)]
+    assert sorted(table.tickers) == [ticker, ticker + "Y"]
+
+    # Keys Kept Whole after Reopening
+    database.close()
+    reopened = type(database)(database.databaseDirectory)
+    table = reopened.getTable("Prices")
+    table.upsert({"Ticker":ticker, "Date":"2024-01-01", "Close":4.0}, ["Ticker","Date"])
+
+    assert rows(table.query(["Ticker","Close"])) == [(ticker,4.0), (ticker + "Y",2.0)]
+    reopened.close()
+
+def test_upsert_values_last_wins(tmp_path):
+    database = Database(str(tmp_path / "test.db"))
+    database.addTable("Prices", [Column("Ticker",str), Column("Date",str), Column("Close",float)], unique=["Ticker","Date"])
+    table = database.getTable("Prices")
+
+    table.upsertValues(["Ticker","Date","Close"], [("AAA","2024-01-01",1.0), ("AAA","2024-01-01",2.0), (None,"2024-01-01",3.0), (None,"2024-01-01",4.0)], ["Ticker","Date"])
+    table.upsertValues(["Ticker","Date","Close"], [("AAA","2024-01-01",5.0), ("AAA","2024-01-01",6.0)], ["Ticker","Date"])
+
+    assert table.connection.execute("SELECT Ticker, Close FROM Prices ORDER BY rowid;").fetchall() == [("AAA",6.0), (None,4.0)]
+    database.close()
@@ -0,0 +1,118 @@
+import threading
+import pytest
+from database import Column, Database
+from fundementals import PriceToBook
+
+
+
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = Database(str(tmp_path / "test.db"))
+    yield database
+    database.close()
+
+@pytest.fixture
+def table(database):
+    database.addTable("Prices", [Column("Ticker",str), Column("Date",str), Column("Close",float)], unique=["Ticker","Date"])
+    return database.getTable("Prices")
+
+def test_as_of(table):
+    table.upsertMany([
+        {"Ticker":"AAA", "Date":"2024-01-01", "Close":1.0},
+        {"Ticker":"AAA", "Date":"2024-01-03", "Close":3.0},
+        {"Ticker":"BBB", "Date":"2024-01-02", "Close":2.0},
+    ], ["Ticker","Date"])
+
+    result = table.asOf(["2024-01-02", "2024-01-03"], ["Close"])
+
+    assert list(result.itertuples(index=False, name=None)) == [
+        ("2024-01-02","2024-01-01","AAA",1.0), ("2024-01-02","2024-01-02","BBB",2.0),
+        ("2024-01-03","2024-01-03","AAA",3.0), ("2024-01-03","2024-01-02","BBB",2.0),
+    ]
+    assert table.asOf("2023-12-31").empty
+
+def test_as_of_without_tickers(table):
+    table.upsertMany([
+        {"Ticker":None, "Date":"2024-01-01", "Close":1.0},
+        {"Ticker":None, "Date":"2024-01-02", "Close":2.0},
+        {"Ticker":"AAA", "Date":"2024-01-01", "Close":5.0},
+    ], ["Ticker","Date"])
+
+    result = table.asOf(["2024-01-01", "2024-01-03"], ["Close"])
+
+    assert [(asOf, ticker, close) for asOf, _, ticker, close in result.itertuples(index=False, name=None)] == [
+        ("2024-01-01","AAA",5.0), ("2024-01-01",None,1.0),
+        ("2024-01-03","AAA",5.0), ("2024-01-03",None,2.0),
+    ]
+
+def test_as_of_fundementals_without_tickers(database):
+    PriceToBook(2.0, database=database)
+
+    result = database.asOf("Fundementals", ["2999-01-01"])
+
+    assert len(result) == 1 and result["PriceToBook"].iloc[0] == 2.0
+
+def test_changes(database, table):
+    database.watch("Prices")
+    table.upsert({"Ticker":"AAA", "Date":"2024-01-01", "Close":1.0}, ["Ticker","Date"])
+    first = database.sequence
+    table.upsert({"Ticker":"BBB", "Date":"2024-01-01", "Close":2.0}, ["Ticker","Date"])
+    table.upsert({"Ticker":"AAA", "Date":"2024-01-01", "Close":3.0}, ["Ticker","Date"])
+
+    assert database.isWatched("Prices")
+    assert list(database.changes("Prices")[["Ticker","Close"]].itertuples(index=False, name=None)) == [("BBB",2.0), ("AAA",3.0)]
+    assert list(database.changes("Prices", database.sequence)["Ticker"]) == []
+
+    database.pruneChanges(first)
+    assert len(database.changes("Prices")) == 2
+
+    database.unwatch("Prices")
+    table.upsert({"Ticker":"CCC", "Date":"2024-01-01", "Close":4.0}, ["Ticker","Date"])
+    assert not database.isWatched("Prices") and "CCC" not in list(database.changes("Prices")["Ticker"])
+
+def test_subscribe(database, table):
+    database.watch("Prices")
+    received = []
+    database.subscribe("Prices", lambda df: received.append(list(df["Ticker"])))
+
+    table.upsert({"Ticker":"AAA", "Date":"2024-01-01", "Close":1.0}, ["Ticker","Date"])
+    with database.transaction():
+        table.upsert({"Ticker":"BBB", "Date":"2024-01-01", "Close":2.0}, ["Ticker","Date"])
+        table.upsert({"Ticker":"CCC", "Date":"2024-01-01", "Close":3.0}, ["Ticker","Date"])
+        assert received == [["AAA"]]
+
+    assert received == [["AAA"], ["BBB","CCC"]]
+
+def test_subscriber_raising(database, table):
+    database.watch("Prices")
+    received = []
+
+    def fail(df):
+        raise RuntimeError("Subscriber Failed")
+
+    database.subscribe("Prices", fail)
+    database.subscribe("Prices", lambda df: received.append(list(df["Ticker"])))
+
+    table.upsert({"Ticker":"AAA", "Date":"2024-01-01", "Close":1.0}, ["Ticker","Date"])
+    with database.transaction():
+        table.upsert({"Ticker":"BBB", "Date":"2024-01-01", "Close":2.0}, ["Ticker","Date"])
+
+    assert received == [["AAA"], ["BBB"]]
+    assert sorted(table.tickers) == ["AAA","BBB"]
+
+def test_connections_of_ended_threads(database, table):
+    def read():
+        table.query()
+
+    for _ in range(50):
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join()
+
+    assert len(database._connections) <= 2
+
+    # The Connection of this Thread is Kept
+    table.upsert({"Ticker":"AAA", "Date":"2024-01-01", "Close":1.0}, ["Ticker","Date"])
+    assert table.tickers == ["AAA"]
@@ -0,0 +1,69 @@
+from math import isnan
+import numpy as np
+import pytest
+from database import Column, Database
+from fundementals import FUNDEMENTALS, PriceToBook, PriceToSales, calculatePercents, recordSnapshot
+
+
+
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = Database(str(tmp_path / "test.db"))
+    yield database
+    database.close()
+
+@pytest.mark.parametrize("fundemental", FUNDEMENTALS, ids=lambda fundemental: fundemental.__name__)
+def test_calculate_percents(fundemental):
+    values = [2.0, 0.5, 0.0, None, -1.0]
+    inputs = [values, values[::-1]][:len(fundemental.inputs)]
+
+    percents = fundemental.calculatePercents(*inputs)
+
+    for percent, row in zip(percents, zip(*inputs)):
+        try:
+            expected = fundemental.calculatePercent(*row)
+        except (TypeError, ZeroDivisionError):
+            expected = None
+
+        if expected is None or isnan(expected):
+            assert isnan(percent)
+        else:
+            assert percent == pytest.approx(expected)
+
+def test_calculate_percents_leaves_inputs():
+    ps = np.array([1.0, 2.0])
+    percents = PriceToSales.calculatePercents(ps)
+    percents[0] = 9.0
+
+    assert ps.tolist() == [1.0, 2.0]
+
+def test_calculate_percents_of_universe():
+    percents = calculatePercents({"pb":[2.0, 4.0], "forwardPE":[10.0, 20.0], "trailingPE":[20.0, 20.0]})
+
+    assert list(percents.columns) == ["PriceToEarnings", "PriceToBook"]
+    assert percents["PriceToEarnings"].tolist() == [0.5, 0.0]
+
+def test_record_snapshot(database):
+    percents = recordSnapshot({"pb":2.0, "forwardPE":20.0, "trailingPE":25.0, "dp":0.0}, database, "AAA", "2024-01-02")
+
+    assert percents == {"PriceToEarnings":pytest.approx(0.2), "PriceToBook":-0.5, "DividendPayout":None}
+
+    data = database.getTable("Fundementals").query()
+    assert len(data) == 1
+    assert data.iloc[0][["Ticker","Date","ForwardPE","TrailingPE","PriceToBook","DividendPayout"]].tolist() == ["AAA","2024-01-02",20.0,25.0,2.0,0.0]
+
+    # The Same Ticker and Date Rewrite the Row
+    recordSnapshot({"pb":4.0}, database, "AAA", "2024-01-02")
+    data = database.getTable("Fundementals").query()
+    assert len(data) == 1 and data["PriceToBook"].iloc[0] == 4.0 and data["ForwardPE"].iloc[0] == 20.0
+
+def test_record_snapshot_without_ticker(database):
+    database.addTable("Fundementals", [Column("Date",str), Column("PriceToBook",float)], unique=["Date"])
+
+    recordSnapshot({"pb":2.0}, database, date="2024-01-02")
+    PriceToBook(3.0, database=database)
+
+    assert "Ticker" not in database.getTable("Fundementals").columns
+    assert sorted(database.getTable("Fundementals").query()["PriceToBook"]) == [2.0, 3.0]
@@ -0,0 +1,74 @@
+import pickle
+from math import isnan
+import numpy as np
+import pytest
+from database import Column, Database
+from history import History, RollingWindow, percentHistory
+
+
+
+
+
+@pytest.fixture
+def table(tmp_path):
+    database = Database(str(tmp_path / "test.db"))
+    database.addTable("Fundementals", [Column("Ticker",str), Column("Date",str), Column("PriceToBook",float)], unique=["Ticker","Date"])
+    yield database.getTable("Fundementals")
+    database.close()
+
+def test_rolling_window():
+    values = np.random.default_rng(0).normal(size=200)
+    values[::7] = np.nan
+    window = RollingWindow(10)
+
+    for position, value in enumerate(values):
+        window.add(value)
+        last = values[max(position - 9, 0):position + 1]
+        last = last[~np.isnan(last)]
+
+        assert window.count == len(last)
+        if not len(last): continue
+
+        assert window.mean == pytest.approx(last.mean())
+        assert window.min == last.min() and window.max == last.max()
+        if len(last) > 1:
+            assert window.std == pytest.approx(last.std(ddof=1))
+            assert isnan(window.zscore) if isnan(value) else window.zscore == pytest.approx((value - last.mean())/last.std(ddof=1))
+
+def test_rolling_window_flat():
+    window = RollingWindow(5)
+
+    for value in [100.0, -3.5, 1e6, 7.25, 0.001] + [1/3]*5:
+        window.add(value)
+
+    assert window.mean == 1/3
+    assert window.std == 0.0
+    assert isnan(window.zscore)
+
+def test_rolling_window_empty():
+    window = RollingWindow(3)
+    window.add(None)
+
+    assert window.count == 0 and isnan(window.mean) and isnan(window.std) and isnan(window.min)
+    with pytest.raises(TypeError):
+        RollingWindow(0)
+
+def test_history(table):
+    table.upsertMany([{"Ticker":"AAA", "Date":f"2024-01-0{day}", "PriceToBook":float(day)} for day in range(1, 4)], ["Ticker","Date"])
+    history = History(table, window=2)
+
+    first = history.update()
+    assert list(first["Date"]) == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    assert history.update().empty
+
+    # Rows Stored Late for an Earlier Date are Taken in, after Pickling
+    table.upsert({"Ticker":"BBB", "Date":"2024-01-01", "PriceToBook":2.0}, ["Ticker","Date"])
+    history = pickle.loads(pickle.dumps(history))
+    history.table = table
+
+    second = history.update()
+    assert list(zip(second["Ticker"], second["Date"])) == [("BBB", "2024-01-01")]
+
+    statistics = history.statistics.set_index(["Ticker", "Fundemental"])
+    assert statistics.loc[("AAA", "PriceToBook"), "Mean"] == pytest.approx(np.mean(percentHistory(table, "AAA")["PriceToBook"].iloc[-2:]))
+    assert statistics.loc[("BBB", "PriceToBook"), "Percent"] == second["PriceToBook"].iloc[0]
@@ -0,0 +1,54 @@
+import json
+import pytest
+from database import Column, Database
+from ingest import ingest, readChunks
+
+
+
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = Database(str(tmp_path / "test.db"))
+    yield database
+    database.close()
+
+def test_ingest_csv(database, tmp_path):
+    file = tmp_path / "snapshot.csv"
+    file.write_text(
+        "symbol,date,pb,forwardPE,trailingPE\n"
+        " aaa ,2024-01-02,2,20,25\n"
+        "BBB,2024-01-02,x,10,\n"
+        ",2024-01-02,1,1,1\n"
+        "AAA,2024-01-02,3,20,25\n"
+        "NAN,not a date,1,1,1\n"
+    )
+
+    result = ingest(database, str(file), {"symbol":"Ticker"}, chunkSize=2)
+
+    assert result["chunks"] == 3
+    assert result["rows"] == 3 and result["rejected"] == 2 and result["invalid"] == 1
+
+    table = database.getTable("Fundementals")
+    data = table.query(["Ticker","Date","PriceToBook","ForwardPE"]).sort_values("Ticker")
+
+    assert list(data.itertuples(index=False, name=None))[0] == ("AAA","2024-01-02",3.0,20.0)
+    assert data["PriceToBook"].isna().tolist() == [False, True]
+    assert sorted(table.tickers) == ["AAA","BBB"]
+
+def test_ingest_adds_columns(database, tmp_path):
+    database.addTable("Fundementals", [Column("Ticker",str), Column("Date",str)], unique=["Ticker","Date"])
+    file = tmp_path / "snapshot.jsonl"
+    file.write_text("\n".join(json.dumps(row) for row in [{"ticker":"AAA", "roe":0.2}, {"ticker":"BBB", "roe":None}]))
+
+    result = ingest(database, str(file), date="2024-01-05")
+
+    assert result["rows"] == 2 and result["percents"] == {"ReturnOnEquity":1}
+    assert list(database.getTable("Fundementals").query(["Ticker","Date","ReturnOnEquity"]).itertuples(index=False, name=None))[0] == ("AAA","2024-01-05",0.2)
+
+def test_read_chunks_errors(tmp_path):
+    with pytest.raises(TypeError):
+        next(readChunks(str(tmp_path / "snapshot.xlsx")))
+
+    with pytest.raises(TypeError):
+        next(readChunks(str(tmp_path / "snapshot.csv"), chunkSize=0))
@@ -0,0 +1,51 @@
+import json
+from http.client import HTTPConnection
+import pytest
+from server import ScoringServer
+
+
+
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = ScoringServer(str(tmp_path / "test.db"), port=0, window=0.001)
+    server.start()
+    yield server
+    server.close()
+
+def post(server, body) -> tuple[int, object]:
+    connection = HTTPConnection(*server.server_address)
+    connection.request("POST", "/score", json.dumps(body), {"Content-Type":"application/json"})
+    response = connection.getresponse()
+    result = response.status, json.loads(response.read())
+    connection.close()
+
+    return result
+
+def test_score(server):
+    status, result = post(server, {"fundemental":"PriceToBook", "ticker":"AAA", "inputs":{"pb":2}})
+
+    assert status == 200 and result["fundemental"] == "PriceToBook" and result["ticker"] == "AAA" and result["percent"] is not None
+    assert server.database.getTable("Fundementals").tickers == ["AAA"]
+
+def test_score_list_with_invalid_request(server):
+    status, results = post(server, [{"fundemental":"PriceToBook", "inputs":{"pb":2}}, {"fundemental":"Nope"}, {"fundemental":"PriceToBook", "inputs":{"pb":"x"}}])
+
+    assert status == 200
+    assert results[0]["fundemental"] == "PriceToBook" and results[0]["percent"] is not None
+    assert results[1] == {"error":"Nope Fundemental Does Not Exist"}
+    assert "error" in results[2]
+
+def test_score_invalid_request(server):
+    assert post(server, {"fundemental":"Nope"})[0] == 400
+    assert post(server, 5)[0] == 400
+
+def test_score_server_error(server, monkeypatch):
+    def fail():
+        raise TypeError("Table Already Exists")
+
+    monkeypatch.setattr(server.database, "transaction", fail)
+
+    assert post(server, {"fundemental":"PriceToBook", "ticker":"AAA", "inputs":{"pb":2}}) == (500, {"error":"Table Already Exists"})
+    assert post(server, {"fundemental":"PriceToBook", "inputs":{"pb":2}})[0] == 200